@@ -6,20 +6,25 @@ Designed to be consumed by a React frontend on Vercel.
 """
 
 import asyncio
+import hashlib
 import os
 import re
 import tempfile
+import time
 import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path, PurePath
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 from urllib.parse import quote
 
+import aiofiles
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from dotenv import load_dotenv
 from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 # Load environment variables
@@ -27,10 +32,27 @@ load_dotenv()
 
 # Import from existing codebase
 from components.job_manager import Job, JobManager
-from main import Config, format_output_row, parse_csv_row, process_batch
+from components.local_job_store import LocalJobStore
+from main import (
+    INPUT_COLUMNS,
+    Config,
+    RestaurantRecord,
+    format_output_row,
+    get_config,
+    parse_records,
+    process_record_stream,
+    read_excel,
+)
 
 # Constants
 MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50 MB
+FILE_CHUNK_SIZE = 1024 * 1024  # 1 MB, for streaming uploads and downloads
+CSV_ROWS_PER_CHUNK = 500
+ARROW_CSV_MIN_SIZE = 2 * 1024 * 1024  # Smaller CSVs parse faster single-threaded
+MAX_CONCURRENT_JOBS = int(os.environ.get("MAX_CONCURRENT_JOBS", "4"))
+ENRICH_BATCH_SIZE = 10  # Concurrent API calls per job
+ENRICH_CHUNK_SIZE = 50  # Rows parsed per worker-thread call while a job is enriched
+REDIS_CHECK_TTL = 5.0  # Seconds to reuse a Redis availability check
 
 
 def sanitize_filename(filename: str) -> str:
@@ -43,38 +65,45 @@ def sanitize_filename(filename: str) -> str:
 # Global job manager instance
 job_manager: Optional[JobManager] = None
 
-# Temporary file storage for uploads (maps job_id -> file_path)
+# Parsed uploads awaiting processing (maps job_id -> pickled DataFrame path)
 upload_files: dict[str, str] = {}
 
-# In-memory job storage for local dev (when Redis unavailable)
-in_memory_jobs: dict[str, dict] = {}
-in_memory_results: dict[str, str] = {}  # job_id -> results file path
+# Responses for uploads awaiting processing, keyed by (session_id, SHA-256 of file contents)
+upload_digests: dict[tuple[str, str], "UploadResponse"] = {}
+
+# SQLite job storage for local dev (when Redis unavailable), shared by all workers
+job_store: Optional[LocalJobStore] = None
 
+# Limits how many enrichment pipelines run at once; later jobs wait for a slot
+enrichment_slots = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
 
-class InMemoryJob:
-    """Simple in-memory job for local development without Redis."""
-    def __init__(self, job_id: str, session_id: str, filename: str, total_records: int):
-        self.job_id = job_id
-        self.session_id = session_id
-        self.filename = filename
-        self.total_records = total_records
-        self.status = "pending"
-        self.processed_records = 0
-        self.error_message = None
-        from datetime import datetime
-        self.created_at = datetime.now()
+
+# Last Redis availability check as (monotonic timestamp, result)
+_redis_check: tuple[float, bool] = (float("-inf"), False)
 
 
 def redis_available() -> bool:
-    """Check if Redis is available."""
-    return job_manager is not None and job_manager.is_available()
+    """Check if Redis is available, reusing the result for REDIS_CHECK_TTL seconds.
+
+    Only called from the event loop, so the cached tuple needs no lock.
+    """
+    global _redis_check
+    now = time.monotonic()
+    checked_at, available = _redis_check
+    if now - checked_at < REDIS_CHECK_TTL:
+        return available
+    available = job_manager is not None and job_manager.is_available()
+    _redis_check = (now, available)
+    return available
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize resources on startup."""
-    global job_manager
+    global job_manager, job_store, _redis_check
     job_manager = JobManager()
+    job_store = LocalJobStore(os.environ.get("JOBS_DB", os.path.join(tempfile.gettempdir(), "jobs.db")))
+    _redis_check = (float("-inf"), False)
     yield
     # Cleanup temp files on shutdown
     for path in upload_files.values():
@@ -142,11 +171,108 @@ class JobListResponse(BaseModel):
     jobs: list[JobStatus]
 
 
+class MessageResponse(BaseModel):
+    """Response carrying only a confirmation message."""
+    message: str
+
+
+class HealthResponse(BaseModel):
+    """Response from health check endpoint."""
+    status: str
+    cors_origins: list[str]
+
+
 # ==============================================================================
 # Helper Functions
 # ==============================================================================
 
 
+def _read_tabular(path: Path, suffix: str, usecols=None) -> pd.DataFrame:
+    """Read a CSV or Excel file into a DataFrame.
+
+    Excel files use the Rust-backed calamine engine, which streams the sheet
+    XML instead of building a DOM like openpyxl does. Columns use Arrow-backed
+    dtypes where they can, so strings sit in contiguous buffers rather than
+    one Python object per cell.
+    """
+    if suffix in [".xlsx", ".xls"]:
+        return read_excel(path, usecols=usecols)
+    if path.stat().st_size > ARROW_CSV_MIN_SIZE:
+        try:
+            return _read_csv_arrow(path, usecols)
+        except pa.ArrowInvalid:
+            # Arrow infers column types from the first block and rejects later
+            # rows that don't fit (e.g. "29407-1234" in an integer zip column)
+            pass
+    return pd.read_csv(path, usecols=usecols, dtype_backend="pyarrow")
+
+
+def _read_csv_arrow(path: Path, usecols=None) -> pd.DataFrame:
+    """Read a CSV with pyarrow, which parses blocks of the file on several threads."""
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+    )
+    if usecols is not None:
+        table = table.select([name for name in table.column_names if usecols(name)])
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _filter_empty_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows with no restaurant name (common in Excel exports)."""
+    if "name" in df.columns:
+        # One string-dtype pass: nulls become "" and fail the same non-blank check
+        has_name = df["name"].astype("string").fillna("").str.strip().ne("")
+        return df.loc[has_name]
+    # Fallback: drop rows where all values are empty
+    return df.dropna(how="all")
+
+
+def _load_and_filter(path: Path, suffix: str) -> pd.DataFrame:
+    """Read an uploaded file, keeping only the input columns and rows that have a name."""
+    df = _read_tabular(path, suffix, usecols=lambda col: col in INPUT_COLUMNS)
+    return _filter_empty_rows(df)
+
+
+def _iter_csv(df: pd.DataFrame) -> Iterator[str]:
+    """Yield result rows as CSV text, a few hundred rows at a time."""
+    for start in range(0, len(df), CSV_ROWS_PER_CHUNK):
+        yield df.iloc[start:start + CSV_ROWS_PER_CHUNK].to_csv(index=False, header=start == 0)
+
+
+def _results_disposition(filename: str) -> str:
+    """Content-Disposition header for downloading a job's enriched CSV."""
+    output_filename = f"enriched_{filename}"
+    if not output_filename.endswith(".csv"):
+        output_filename = output_filename.rsplit(".", 1)[0] + ".csv"
+    return f'attachment; filename="{sanitize_filename(output_filename)}"'
+
+
+async def _produce_records(df: pd.DataFrame, queue: asyncio.Queue) -> None:
+    """Parse df chunk by chunk in a worker thread and feed records into queue.
+
+    Puts None once all rows are parsed (or parsing fails) so the consumer stops.
+    """
+    try:
+        for start in range(0, len(df), ENRICH_CHUNK_SIZE):
+            chunk = df.iloc[start:start + ENRICH_CHUNK_SIZE]
+            # Rows that fail to parse are skipped
+            records = await asyncio.to_thread(parse_records, chunk, lambda e: None)
+            for record in records:
+                await queue.put(record)
+    except Exception:
+        await queue.put(None)
+        raise
+    await queue.put(None)
+
+
+async def _queued_records(queue: asyncio.Queue) -> AsyncIterator[RestaurantRecord]:
+    """Yield records from queue until None arrives."""
+    while (record := await queue.get()) is not None:
+        yield record
+
+
 def job_to_status(job: Job) -> JobStatus:
     """Convert Job dataclass to JobStatus response model."""
     return JobStatus(
@@ -162,90 +288,98 @@ def job_to_status(job: Job) -> JobStatus:
 
 
 async def run_enrichment(job_id: str, file_path: str, config: Config) -> None:
-    """Background task to run the enrichment pipeline."""
+    """Background task to run the enrichment pipeline.
+
+    At most MAX_CONCURRENT_JOBS pipelines run at once; other jobs show as
+    processing with a "Queued" message until a slot frees up.
+    """
     use_redis = redis_available()
 
     # Mark job as processing
     if use_redis:
-        job_manager.update_progress(job_id, 0, 1, "Starting...")
-    elif job_id in in_memory_jobs:
-        in_memory_jobs[job_id].status = "processing"
+        job_manager.mark_processing(job_id)
+        job_manager.update_progress(job_id, 0, 1, "Queued...")
+    else:
+        job_store.mark_processing(job_id)
 
+    await enrichment_slots.acquire()
     try:
-        # Read file
-        path = Path(file_path)
-        if path.suffix.lower() in [".xlsx", ".xls"]:
-            df = pd.read_excel(path)
-        else:
-            df = pd.read_csv(path)
-
-        # Filter out empty rows (rows where 'name' column is empty/null)
-        if "name" in df.columns:
-            df = df[df["name"].notna() & (df["name"].astype(str).str.strip() != "")]
-        else:
-            # Fallback: drop rows where all values are empty
-            df = df.dropna(how="all")
-
-        # Parse records
-        records = []
-        for _, row in df.iterrows():
-            try:
-                record = parse_csv_row(row)
-                records.append(record)
-            except Exception:
-                continue
+        if use_redis:
+            job_manager.update_progress(job_id, 0, 1, "Starting...")
 
-        if not records:
-            if use_redis:
-                job_manager.mark_failed(job_id, "No valid records found in file")
-            elif job_id in in_memory_jobs:
-                in_memory_jobs[job_id].status = "failed"
-                in_memory_jobs[job_id].error_message = "No valid records found in file"
-            return
+        # Load the frame parsed and filtered by upload_file
+        df = await asyncio.to_thread(pd.read_pickle, file_path)
 
         # Progress callback for job updates
         def progress_callback(current: int, total: int, message: str) -> None:
             if use_redis:
                 job_manager.update_progress(job_id, current, total, message)
-            elif job_id in in_memory_jobs:
-                in_memory_jobs[job_id].processed_records = current
-
-        # Run processing
-        results = await process_batch(
-            records=records,
-            config=config,
-            batch_size=10,
-            progress_callback=progress_callback,
-        )
+            else:
+                job_store.update_progress(job_id, current)
+
+        # Parse and enrich concurrently: the producer parses rows into a bounded
+        # queue while process_record_stream enriches each record as it arrives
+        queue: asyncio.Queue = asyncio.Queue(maxsize=ENRICH_CHUNK_SIZE * 2)
+        producer = asyncio.create_task(_produce_records(df, queue))
+        try:
+            results = await process_record_stream(
+                _queued_records(queue),
+                len(df),
+                config,
+                batch_size=ENRICH_BATCH_SIZE,
+                progress_callback=progress_callback,
+            )
+            await producer  # Surface parsing errors
+        finally:
+            producer.cancel()
+
+        if not results:
+            if use_redis:
+                job_manager.mark_failed(job_id, "No valid records found in file")
+            else:
+                job_store.mark_failed(job_id, "No valid records found in file")
+            return
 
         # Convert results to dicts and save
         result_dicts = [format_output_row(r) for r in results]
         if use_redis:
-            job_manager.save_results(job_id, result_dicts)
+            # Build the CSV export once so downloads just send stored bytes
+            await asyncio.to_thread(
+                job_manager.save_results_csv, job_id, pd.DataFrame(result_dicts)
+            )
+            await asyncio.to_thread(job_manager.save_results, job_id, result_dicts)
             job_manager.mark_completed(job_id)
         else:
-            # Save results to temp file for in-memory mode
+            # Save results to temp file for local mode
             results_file = tempfile.NamedTemporaryFile(delete=False, suffix=".csv", mode="w")
-            pd.DataFrame(result_dicts).to_csv(results_file.name, index=False)
-            in_memory_results[job_id] = results_file.name
-            if job_id in in_memory_jobs:
-                in_memory_jobs[job_id].status = "completed"
-                in_memory_jobs[job_id].processed_records = len(results)
+            results_file.close()
+            await asyncio.to_thread(
+                lambda: pd.DataFrame(result_dicts).to_csv(results_file.name, index=False)
+            )
+            job_store.mark_completed(job_id, len(results), results_file.name)
 
     except Exception as e:
         if use_redis:
             job_manager.mark_failed(job_id, str(e))
-        elif job_id in in_memory_jobs:
-            in_memory_jobs[job_id].status = "failed"
-            in_memory_jobs[job_id].error_message = str(e)
+        else:
+            job_store.mark_failed(job_id, str(e))
 
     finally:
+        enrichment_slots.release()
+
         # Clean up temp file
         try:
             os.unlink(file_path)
         except OSError:
             pass
         upload_files.pop(job_id, None)
+        _forget_upload_digest(job_id)
+
+
+def _forget_upload_digest(job_id: str) -> None:
+    """Stop offering job_id to re-uploads of the same file."""
+    for key in [k for k, r in upload_digests.items() if r.job_id == job_id]:
+        del upload_digests[key]
 
 
 # ==============================================================================
@@ -276,71 +410,86 @@ async def upload_file(file: UploadFile = File(...), session_id: Optional[str] =
 
     # Save to temp file
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    temp_file.close()
     try:
-        content = await file.read()
+        # Stream the upload to disk in chunks so memory stays flat regardless of file size
+        size = 0
+        hasher = hashlib.sha256()
+        async with aiofiles.open(temp_file.name, "wb") as out:
+            while chunk := await file.read(FILE_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    break
+                hasher.update(chunk)
+                await out.write(chunk)
 
         # Validate file size
-        if len(content) > MAX_UPLOAD_SIZE:
+        if size > MAX_UPLOAD_SIZE:
+            os.unlink(temp_file.name)
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024*1024)}MB."
             )
 
-        temp_file.write(content)
-        temp_file.close()
-
-        # Read to get record count
-        path = Path(temp_file.name)
-        if suffix in [".xlsx", ".xls"]:
-            df = pd.read_excel(path)
-        else:
-            df = pd.read_csv(path)
-
-        # Filter out empty rows (rows where 'name' column is empty/null)
-        if "name" in df.columns:
-            df = df[df["name"].notna() & (df["name"].astype(str).str.strip() != "")]
-        else:
-            # Fallback: drop rows where all values are empty
-            df = df.dropna(how="all")
+        # Same file uploaded again before its job was started: reuse that job
+        digest_key = (session_id, hasher.hexdigest()) if session_id else None
+        if digest_key in upload_digests:
+            previous = upload_digests[digest_key]
+            manager = job_manager if redis_available() else job_store
+            previous_job = manager.get_job(previous.job_id)
+            if previous_job and previous_job.status == "pending" and previous.job_id in upload_files:
+                os.unlink(temp_file.name)
+                return previous
+            del upload_digests[digest_key]
 
+        # Read and filter the file in a worker thread to get the record count
+        df = await asyncio.to_thread(_load_and_filter, Path(temp_file.name), suffix)
         total_records = len(df)
 
         if total_records == 0:
             os.unlink(temp_file.name)
             raise HTTPException(status_code=400, detail="File contains no records.")
 
+        # Keep the parsed frame so run_enrichment doesn't parse the file a second time
+        frame_path = f"{temp_file.name}.pkl"
+        await asyncio.to_thread(df.to_pickle, frame_path)
+        os.unlink(temp_file.name)
+
         # Use provided session_id or generate one
         if not session_id:
             session_id = "api-" + str(uuid.uuid4())[:8]
 
-        # Try Redis first, fall back to in-memory
+        # Try Redis first, fall back to local SQLite store
         if redis_available():
             job_id = job_manager.create_job(session_id, filename, total_records)
             if not job_id:
-                os.unlink(temp_file.name)
+                os.unlink(frame_path)
                 raise HTTPException(status_code=500, detail="Failed to create job.")
         else:
-            # In-memory fallback for local development
-            job_id = str(uuid.uuid4())
-            in_memory_jobs[job_id] = InMemoryJob(job_id, session_id, filename, total_records)
+            # Local fallback for development; the path lets any worker start the job
+            job_id = job_store.create_job(session_id, filename, total_records, frame_path)
 
-        # Store temp file path for later processing
-        upload_files[job_id] = temp_file.name
+        # Store parsed frame path for later processing
+        upload_files[job_id] = frame_path
 
-        return UploadResponse(
+        response = UploadResponse(
             job_id=job_id,
             filename=filename,
             total_records=total_records,
             message=f"File uploaded successfully. {total_records} records ready for processing.",
         )
+        if digest_key:
+            upload_digests[digest_key] = response
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
-        try:
-            os.unlink(temp_file.name)
-        except OSError:
-            pass
+        for path in (temp_file.name, f"{temp_file.name}.pkl"):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
         raise HTTPException(status_code=500, detail=f"Failed to process file: {str(e)}")
 
 
@@ -351,43 +500,37 @@ async def start_job(job_id: str, background_tasks: BackgroundTasks):
 
     The processing runs in the background. Use GET /api/jobs/{job_id} to check status.
     """
-    # Verify job exists (check both Redis and in-memory)
-    if redis_available():
-        job = job_manager.get_job(job_id)
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found.")
-        if job.status != "pending":
-            raise HTTPException(
-                status_code=400,
-                detail=f"Job cannot be started. Current status: {job.status}",
-            )
-    else:
-        job = in_memory_jobs.get(job_id)
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found.")
-        if job.status != "pending":
-            raise HTTPException(
-                status_code=400,
-                detail=f"Job cannot be started. Current status: {job.status}",
-            )
+    # Verify job exists (check both Redis and the local store)
+    use_redis = redis_available()
+    job = job_manager.get_job(job_id) if use_redis else job_store.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    if job.status != "pending":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job cannot be started. Current status: {job.status}",
+        )
 
-    # Verify we have the file
-    if job_id not in upload_files:
+    # Verify we have the file (local jobs may have been uploaded through another worker)
+    file_path = upload_files.get(job_id)
+    if file_path is None and not use_redis:
+        file_path = job_store.get_upload_path(job_id)
+    if not file_path or not os.path.exists(file_path):
         raise HTTPException(
             status_code=400,
             detail="Upload file not found. Please upload the file again.",
         )
 
     # Validate API keys
-    config = Config()
+    config = get_config()
     if not config.google_places_api_key or not config.openrouter_api_key:
         raise HTTPException(
             status_code=500,
             detail="Required API keys (GOOGLE_PLACES_API_KEY, OPENROUTER_API_KEY) not configured.",
         )
 
-    # Start background processing
-    file_path = upload_files[job_id]
+    # Start background processing; from here on a re-upload gets a new job
+    _forget_upload_digest(job_id)
     background_tasks.add_task(run_enrichment, job_id, file_path, config)
 
     return JobStartResponse(
@@ -403,25 +546,10 @@ async def get_job_status(job_id: str):
 
     Status can be: pending, processing, completed, failed
     """
-    if redis_available():
-        job = job_manager.get_job(job_id)
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found.")
-        return job_to_status(job)
-    else:
-        # In-memory fallback
-        job = in_memory_jobs.get(job_id)
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found.")
-        return JobStatus(
-            id=job.job_id,
-            status=job.status,
-            filename=job.filename,
-            total_records=job.total_records,
-            processed_records=job.processed_records,
-            error_message=job.error_message,
-            created_at=job.created_at.isoformat(),
-        )
+    job = job_manager.get_job(job_id) if redis_available() else job_store.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job_to_status(job)
 
 
 @app.get("/api/jobs/{job_id}/results")
@@ -442,17 +570,24 @@ async def get_job_results(job_id: str):
                 detail=f"Results not available. Job status: {job.status}",
             )
 
+        csv_bytes = job_manager.get_results_csv(job_id)
+        if csv_bytes:
+            return Response(
+                csv_bytes,
+                media_type="text/csv",
+                headers={"Content-Disposition": _results_disposition(job.filename)},
+            )
+
+        # Jobs completed before CSV exports were stored only have result dicts
         results = job_manager.get_job_results(job_id)
-        if not results:
+        if results is None or results.empty:
             raise HTTPException(status_code=404, detail="Results not found.")
 
-        # Convert to CSV
-        df = pd.DataFrame(results)
-        csv_content = df.to_csv(index=False)
-        output_filename = f"enriched_{job.filename}"
+        # Stream rows out as CSV instead of building the whole file in memory
+        content = _iter_csv(results)
     else:
-        # In-memory fallback
-        job = in_memory_jobs.get(job_id)
+        # Local fallback
+        job = job_store.get_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found.")
 
@@ -462,22 +597,21 @@ async def get_job_results(job_id: str):
                 detail=f"Results not available. Job status: {job.status}",
             )
 
-        results_path = in_memory_results.get(job_id)
+        results_path = job_store.get_results_path(job_id)
         if not results_path or not os.path.exists(results_path):
             raise HTTPException(status_code=404, detail="Results not found.")
 
-        df = pd.read_csv(results_path)
-        csv_content = df.to_csv(index=False)
-        output_filename = f"enriched_{job.filename}"
-
-    if not output_filename.endswith(".csv"):
-        output_filename = output_filename.rsplit(".", 1)[0] + ".csv"
+        # Results are already a CSV file on disk, so send its bytes as-is
+        return FileResponse(
+            results_path,
+            media_type="text/csv",
+            headers={"Content-Disposition": _results_disposition(job.filename)},
+        )
 
-    safe_filename = sanitize_filename(output_filename)
     return StreamingResponse(
-        iter([csv_content]),
+        content,
         media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{safe_filename}"'},
+        headers={"Content-Disposition": _results_disposition(job.filename)},
     )
 
 
@@ -494,26 +628,12 @@ async def list_jobs(session_id: Optional[str] = None):
 
     if redis_available():
         jobs = job_manager.get_user_jobs(session_id)
-        return JobListResponse(jobs=[job_to_status(job) for job in jobs])
     else:
-        # In-memory fallback
-        jobs = [
-            JobStatus(
-                id=job.job_id,
-                status=job.status,
-                filename=job.filename,
-                total_records=job.total_records,
-                processed_records=job.processed_records,
-                error_message=job.error_message,
-                created_at=job.created_at.isoformat(),
-            )
-            for job in in_memory_jobs.values()
-            if job.session_id == session_id
-        ]
-        return JobListResponse(jobs=sorted(jobs, key=lambda j: j.created_at, reverse=True))
+        jobs = job_store.get_user_jobs(session_id)
+    return JobListResponse(jobs=[job_to_status(job) for job in jobs])
 
 
-@app.delete("/api/jobs/{job_id}")
+@app.delete("/api/jobs/{job_id}", response_model=MessageResponse)
 async def delete_job(job_id: str, session_id: Optional[str] = None):
     """Delete a specific job."""
     if redis_available():
@@ -522,32 +642,25 @@ async def delete_job(job_id: str, session_id: Optional[str] = None):
             return {"message": f"Job {job_id} deleted"}
         raise HTTPException(status_code=500, detail="Failed to delete job")
     else:
-        # In-memory fallback
-        if job_id in in_memory_jobs:
-            del in_memory_jobs[job_id]
-            if job_id in in_memory_results:
-                del in_memory_results[job_id]
+        # Local fallback
+        if job_store.delete_job(job_id):
             return {"message": f"Job {job_id} deleted"}
         raise HTTPException(status_code=404, detail="Job not found")
 
 
-@app.delete("/api/jobs")
+@app.delete("/api/jobs", response_model=MessageResponse)
 async def delete_all_jobs(session_id: str):
     """Delete all jobs for a session."""
     if redis_available():
         deleted = job_manager.delete_all_jobs(session_id)
         return {"message": f"Deleted {deleted} jobs"}
     else:
-        # In-memory fallback
-        to_delete = [jid for jid, job in in_memory_jobs.items() if job.session_id == session_id]
-        for jid in to_delete:
-            del in_memory_jobs[jid]
-            if jid in in_memory_results:
-                del in_memory_results[jid]
-        return {"message": f"Deleted {len(to_delete)} jobs"}
+        # Local fallback
+        deleted = job_store.delete_all_jobs(session_id)
+        return {"message": f"Deleted {deleted} jobs"}
 
 
-@app.get("/api/health")
+@app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint for monitoring."""
     return {
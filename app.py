@@ -59,6 +59,12 @@ st.markdown('''
 ''', unsafe_allow_html=True)
 
 
+@st.cache_resource(show_spinner=False)
+def _shared_job_manager() -> JobManager:
+    """One JobManager per process, so every browser session shares its Redis connection pool."""
+    return JobManager()
+
+
 def main_app() -> None:
     """Main application logic after authentication."""
     # Set default processing settings (sidebar removed)
@@ -78,7 +84,11 @@ def main_app() -> None:
     
     # Initialize job manager for persistence
     if "job_manager" not in st.session_state:
-        st.session_state.job_manager = JobManager()
+        job_manager = _shared_job_manager()
+        if job_manager.redis is None:
+            # Don't keep a manager that couldn't connect; the next session tries again
+            _shared_job_manager.clear()
+        st.session_state.job_manager = job_manager
 
     # Generate session ID for job tracking
     if "session_id" not in st.session_state:
@@ -142,26 +152,24 @@ def main_app() -> None:
     if st.button("Start Enrichment", type="primary"):
         # Lazy import heavy modules only when processing starts
         # This significantly speeds up initial page load
-        from main import Config, parse_csv_row
+        from main import get_config, parse_records
         from components.progress import run_processing
 
-        config = Config()
+        config = get_config()
 
         # Apply limit to dataframe
         df_to_process = df.head(limit) if limit > 0 else df
 
         # Parse CSV rows to RestaurantRecord objects
-        records = []
         parse_errors = 0
 
-        for _, row in df_to_process.iterrows():
-            try:
-                record = parse_csv_row(row)
-                records.append(record)
-            except Exception as e:
-                parse_errors += 1
-                if parse_errors <= 3:  # Only show first 3 errors
-                    st.warning(f"Heads up - had trouble parsing a row: {str(e)[:100]}")
+        def on_parse_error(e: Exception) -> None:
+            nonlocal parse_errors
+            parse_errors += 1
+            if parse_errors <= 3:  # Only show first 3 errors
+                st.warning(f"Heads up - had trouble parsing a row: {str(e)[:100]}")
+
+        records = parse_records(df_to_process, on_error=on_parse_error)
 
         if parse_errors > 3:
             st.warning(f"... and {parse_errors - 3} more rows had parsing issues")
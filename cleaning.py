@@ -0,0 +1,60 @@
+"""
+Per-value cleaning helpers for input rows.
+
+These run for every cell of every parsed row, so they live in their own
+fully annotated module that can be compiled with mypyc:
+
+    pip install mypy && mypyc cleaning.py
+
+The compiled extension is imported in place of this file when present;
+without it the module runs as plain Python with the same behavior.
+"""
+
+import operator
+import re
+from typing import Optional
+
+_RE_DBA = re.compile(r'\bDBA\s+(.+)$', re.IGNORECASE)
+
+
+def is_missing(val: object) -> bool:
+    """pd.isna for a scalar cell, without pandas' dispatch (None, NaN, pd.NA or NaT)."""
+    # pd.NA is matched by type name so this module needn't import pandas, which has
+    # no type stubs for mypyc; it must be checked first because bool(pd.NA) raises.
+    # NaN and NaT are the only other values not equal to themselves (operator.ne
+    # rather than != because numpy returns numpy.bool_, not the bool mypyc expects)
+    return val is None or type(val).__name__ == "NAType" or bool(operator.ne(val, val))
+
+
+def clean_str(val: object) -> str:
+    """Clean a value to string, handling NaN and None."""
+    if is_missing(val):
+        return ""
+    s = str(val).strip()
+    if s.lower() == "nan":
+        return ""
+    return s
+
+
+def clean_fein(val: object) -> str:
+    """Clean FEIN value, removing decimal places from float conversion."""
+    if is_missing(val):
+        return ""
+    # If it's a float that represents an int, convert properly
+    if isinstance(val, float) and val == int(val):
+        return str(int(val))
+    s = str(val).strip()
+    if s.lower() == "nan":
+        return ""
+    # Remove .0 suffix if present
+    if s.endswith(".0"):
+        s = s[:-2]
+    return s
+
+
+def extract_dba_from_name(llc_name: str) -> Optional[str]:
+    """Extract DBA from LLC name if present (e.g., 'BUMPER CROP LLC DBA FIG')."""
+    dba_match = _RE_DBA.search(llc_name)
+    if dba_match:
+        return dba_match.group(1).strip()
+    return None
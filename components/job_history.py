@@ -1,14 +1,26 @@
 """Job history component for Streamlit app."""
 
 import io
-import time
 from datetime import datetime
+from types import MappingProxyType
+from typing import Optional
 
-import pandas as pd
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 
 from components.job_manager import Job, JobManager
 
+# Job history polling intervals; each step is used once progress stalls for two polls
+POLL_INTERVALS_MS = (5000, 10000, 20000)
+
+# Status badge colors
+STATUS_ICONS = MappingProxyType({
+    "processing": "🟡",
+    "completed": "🟢",
+    "failed": "🔴",
+    "pending": "⚪",
+})
+
 
 def render_job_history(job_manager: JobManager, session_id: str) -> None:
     """Render job history section.
@@ -26,17 +38,17 @@ def render_job_history(job_manager: JobManager, session_id: str) -> None:
             )
         return
 
-    jobs = job_manager.get_user_jobs(session_id)
-
-    # Check if any jobs are still processing
-    has_processing = any(job.status == "processing" for job in jobs) if jobs else False
+    # Check if any jobs are still running (one SCARD, not a scan of the jobs)
+    has_processing = job_manager.has_active_jobs(session_id)
+    jobs = job_manager.get_user_jobs_with_progress(session_id)
+    poll_interval_ms = _poll_interval_ms(jobs) if has_processing else None
 
     with st.expander("📋 Job History", expanded=has_processing):
         # Header with refresh button
         col1, col2 = st.columns([4, 1])
         with col1:
             if has_processing:
-                st.caption("🔄 Auto-refreshing every 5 seconds...")
+                st.caption(f"🔄 Auto-refreshing every {poll_interval_ms // 1000} seconds...")
             elif not jobs:
                 st.caption("Your enrichment runs will appear here")
         with col2:
@@ -45,28 +57,33 @@ def render_job_history(job_manager: JobManager, session_id: str) -> None:
 
         if jobs:
             st.divider()
-            for job in jobs:
-                _render_job_card(job, job_manager)
+            for job, progress in jobs:
+                _render_job_card(job, progress, job_manager)
         else:
             st.write("No jobs yet. Start an enrichment to see it here!")
 
-    # Auto-refresh if jobs are processing and user isn't actively processing now
+    # Auto-refresh if jobs are processing and user isn't actively processing now.
+    # The browser schedules the rerun, so no script thread sits idle waiting.
     if has_processing and "processing_results" not in st.session_state:
-        time.sleep(5)
-        st.rerun()
+        st_autorefresh(interval=poll_interval_ms, key="jobs_poll")
 
 
-def _render_job_card(job: Job, job_manager: JobManager) -> None:
+def _poll_interval_ms(jobs: list[tuple[Job, Optional[dict]]]) -> int:
+    """Pick the refresh interval, backing off while processing jobs make no progress."""
+    processed = {job.id: job.processed_records for job, _ in jobs if job.status == "processing"}
+    if processed == st.session_state.get("jobs_poll_processed"):
+        st.session_state.jobs_poll_idle = st.session_state.get("jobs_poll_idle", 0) + 1
+    else:
+        st.session_state.jobs_poll_idle = 0
+    st.session_state.jobs_poll_processed = processed
+
+    step = min(st.session_state.jobs_poll_idle // 2, len(POLL_INTERVALS_MS) - 1)
+    return POLL_INTERVALS_MS[step]
+
+
+def _render_job_card(job: Job, progress: Optional[dict], job_manager: JobManager) -> None:
     """Render a single job card with status and actions."""
-    # Status badge colors
-    status_colors = {
-        "processing": "🟡",
-        "completed": "🟢", 
-        "failed": "🔴",
-        "pending": "⚪"
-    }
-    
-    status_icon = status_colors.get(job.status, "⚪")
+    status_icon = STATUS_ICONS.get(job.status, "⚪")
     
     col1, col2, col3 = st.columns([3, 2, 2])
     
@@ -88,7 +105,6 @@ def _render_job_card(job: Job, job_manager: JobManager) -> None:
             st.caption(f"Error: {job.error_message[:30]}..." if job.error_message else "Unknown error")
         elif job.status == "processing":
             # Show progress
-            progress = job_manager.get_progress(job.id)
             if progress:
                 pct = progress.get("current", 0) / max(progress.get("total", 1), 1)
                 st.progress(pct)
@@ -100,7 +116,7 @@ def _show_job_results(job: Job, job_manager: JobManager) -> None:
     """Display results for a completed job in a modal-like expander."""
     results = job_manager.get_job_results(job.id)
     
-    if not results:
+    if results is None or results.empty:
         st.warning("Results no longer available")
         return
     
@@ -128,12 +144,11 @@ def render_viewed_job_results() -> bool:
         st.rerun()
     
     # Display as dataframe
-    df = pd.DataFrame(results)
-    st.dataframe(df, hide_index=True)
+    st.dataframe(results, hide_index=True)
     
     # Download button
     csv_buffer = io.StringIO()
-    df.to_csv(csv_buffer, index=False)
+    results.to_csv(csv_buffer, index=False)
     csv_bytes = csv_buffer.getvalue().encode("utf-8")
     
     st.download_button(
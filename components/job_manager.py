@@ -1,7 +1,7 @@
 """
 Redis-based job persistence for async enrichment processing.
 
-Provides job state management with GZIP-compressed result storage
+Provides job state management with Parquet result storage
 and automatic 7-day TTL on all keys.
 """
 
@@ -9,11 +9,20 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 import gzip
-import json
+import io
 import os
+import time
 import uuid
 
+import orjson
+import pandas as pd
 import redis
+import zstandard
+from redis.cache import CacheConfig
+
+# Compression level for CSV exports (zstd 3 is much faster than gzip's default 9 at a similar ratio)
+ZSTD_LEVEL = 3
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 
 @dataclass
@@ -31,23 +40,40 @@ class Job:
 
 class JobManager:
     """
-    Manages job persistence in Redis with GZIP compression for results.
+    Manages job persistence in Redis with columnar (Parquet) storage for results.
     
     Redis Schema:
-        job:{uuid}:meta      -> JSON: {id, status, filename, total, processed, created_at, completed_at, error}
-        job:{uuid}:results   -> GZIP-compressed JSON array of result dicts
+        job:{uuid}:meta      -> JSON: {id, session_id, status, filename, total, processed, created_at, completed_at, error}
+        job:{uuid}:results   -> Parquet (zstd) table of result rows
+                                (older jobs: GZIP-compressed JSON array of result dicts)
+        job:{uuid}:results_csv -> zstd-compressed CSV export of the results (older jobs: GZIP)
         job:{uuid}:progress  -> JSON: {current, total, message}
+                                (while a job runs, only this key is written; readers
+                                take the processed count from it)
         user:{session_id}:jobs -> List of job IDs (max 10, newest first)
+        user:{session_id}:active -> Set of IDs of the user's pending/processing jobs
     
     All keys have 7-day TTL.
     """
     
     TTL_SECONDS = 604800  # 7 days
     MAX_JOBS_PER_USER = 10
+    MAX_CONNECTIONS = 32  # Pool size per JobManager; app.py and api.py each keep one per process
+    AVAILABILITY_TTL = 2.0  # Seconds to reuse a successful ping
+
+    # Push a job ID onto a user's capped list and refresh its TTL atomically
+    # KEYS[1] = user jobs key; ARGV = job_id, max jobs, TTL seconds
+    PUSH_JOB_SCRIPT = """
+        redis.call('LPUSH', KEYS[1], ARGV[1])
+        redis.call('LTRIM', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+        redis.call('EXPIRE', KEYS[1], ARGV[3])
+        return 1
+    """
     
     def __init__(self):
         """Initialize Redis connection. Set self.redis to None if unavailable."""
         self.redis: Optional[redis.Redis] = None
+        self._available_at = float("-inf")  # Monotonic time of the last successful ping
         redis_url = os.environ.get("REDIS_URL", "")
 
         # Skip if no Redis URL configured
@@ -55,30 +81,48 @@ class JobManager:
             return
 
         try:
-            self.redis = redis.from_url(
+            cache_kwargs = {}
+            if os.environ.get("REDIS_CLIENT_CACHE", "").lower() in ("1", "true", "yes"):
+                # RESP3 client-side caching: repeated reads are served locally and
+                # invalidated by the server when the key changes (needs Redis 7.4+)
+                cache_kwargs = {"protocol": 3, "cache_config": CacheConfig(max_size=1024)}
+
+            # Blocking pool: concurrent sessions get their own connections and
+            # wait for a free one instead of failing when all are busy
+            pool = redis.BlockingConnectionPool.from_url(
                 redis_url,
-                decode_responses=False,
+                max_connections=self.MAX_CONNECTIONS,
+                timeout=5,  # Seconds to wait for a free connection
                 socket_connect_timeout=2,  # 2 second timeout
-                socket_timeout=2
+                socket_timeout=2,
+                socket_keepalive=True,
+                health_check_interval=30,
+                **cache_kwargs
             )
+            self.redis = redis.Redis(connection_pool=pool)
             # Test connection with timeout
             self.redis.ping()
+            # Preloaded so create_job's pipeline can EVALSHA it without a SCRIPT EXISTS check
+            self._push_job_sha = self.redis.script_load(self.PUSH_JOB_SCRIPT)
         except (redis.ConnectionError, redis.RedisError, redis.TimeoutError) as e:
             self.redis = None
     
     def is_available(self) -> bool:
-        """Check if Redis is available."""
+        """Check if Redis is available, reusing a successful ping for AVAILABILITY_TTL seconds."""
         if self.redis is None:
             return False
+        if time.monotonic() - self._available_at < self.AVAILABILITY_TTL:
+            return True
         try:
             self.redis.ping()
+            self._available_at = time.monotonic()
             return True
         except (redis.ConnectionError, redis.RedisError):
             return False
     
     def create_job(self, session_id: str, filename: str, total_records: int) -> Optional[str]:
         """Create a new job, return job_id or None if Redis unavailable."""
-        if not self.is_available():
+        if self.redis is None:
             return None
         
         try:
@@ -87,6 +131,7 @@ class JobManager:
             
             meta = {
                 "id": job_id,
+                "session_id": session_id,
                 "status": "pending",
                 "filename": filename,
                 "total": total_records,
@@ -96,212 +141,337 @@ class JobManager:
                 "error": None
             }
             
-            meta_key = f"job:{job_id}:meta"
-            progress_key = f"job:{job_id}:progress"
-            user_jobs_key = f"user:{session_id}:jobs"
-            
-            # Store job metadata
-            self.redis.set(
-                meta_key,
-                json.dumps(meta).encode(),
-                ex=self.TTL_SECONDS
-            )
-            
-            # Initialize progress
-            progress = {"current": 0, "total": total_records, "message": ""}
-            self.redis.set(
-                progress_key,
-                json.dumps(progress).encode(),
-                ex=self.TTL_SECONDS
-            )
-            
-            # Add to user's job list (newest first)
-            self.redis.lpush(user_jobs_key, job_id.encode())
-            self.redis.ltrim(user_jobs_key, 0, self.MAX_JOBS_PER_USER - 1)
-            self.redis.expire(user_jobs_key, self.TTL_SECONDS)
+            try:
+                self._create_job_pipeline(meta).execute()
+            except redis.exceptions.NoScriptError:
+                # The server dropped its script cache (restart or SCRIPT FLUSH); the
+                # other writes are idempotent, so reload the script and send them all again
+                self._push_job_sha = self.redis.script_load(self.PUSH_JOB_SCRIPT)
+                self._create_job_pipeline(meta).execute()
             
             return job_id
         except (redis.ConnectionError, redis.RedisError):
             return None
     
+    def _create_job_pipeline(self, meta: dict) -> redis.client.Pipeline:
+        """Queue every write for a new job in a pipeline, sent in one round-trip on execute()."""
+        job_id = meta["id"]
+        session_id = meta["session_id"]
+        meta_key = f"job:{job_id}:meta"
+        progress_key = f"job:{job_id}:progress"
+        user_jobs_key = f"user:{session_id}:jobs"
+        active_key = f"user:{session_id}:active"
+
+        pipe = self.redis.pipeline(transaction=False)
+
+        # Store job metadata
+        pipe.set(
+            meta_key,
+            orjson.dumps(meta),
+            ex=self.TTL_SECONDS
+        )
+
+        # Initialize progress
+        progress = {"current": 0, "total": meta["total"], "message": ""}
+        pipe.set(
+            progress_key,
+            orjson.dumps(progress),
+            ex=self.TTL_SECONDS
+        )
+
+        # Add to user's job list (newest first)
+        pipe.evalsha(
+            self._push_job_sha, 1, user_jobs_key,
+            job_id, self.MAX_JOBS_PER_USER, self.TTL_SECONDS
+        )
+
+        # Track the job as active until it completes or fails
+        pipe.sadd(active_key, job_id)
+        pipe.expire(active_key, self.TTL_SECONDS)
+        return pipe
+
+    def mark_processing(self, job_id: str) -> bool:
+        """Mark job as processing."""
+        if self.redis is None:
+            return False
+
+        try:
+            meta_key = f"job:{job_id}:meta"
+            meta_raw = self.redis.get(meta_key)
+
+            if not meta_raw:
+                return False
+
+            meta = orjson.loads(meta_raw)
+            meta["status"] = "processing"
+
+            self.redis.set(
+                meta_key,
+                orjson.dumps(meta),
+                ex=self.TTL_SECONDS
+            )
+
+            return True
+        except (redis.ConnectionError, redis.RedisError, orjson.JSONDecodeError):
+            return False
+
     def update_progress(self, job_id: str, current: int, total: int, message: str = "") -> bool:
-        """Update job progress. Returns True on success."""
-        if not self.is_available():
+        """Update job progress. Returns True on success.
+
+        Only the progress key is written; the metadata's processed count is
+        brought up to date when the job completes or fails.
+        """
+        if self.redis is None:
             return False
         
         try:
-            progress_key = f"job:{job_id}:progress"
-            meta_key = f"job:{job_id}:meta"
-            
-            # Update progress
             progress = {"current": current, "total": total, "message": message}
             self.redis.set(
-                progress_key,
-                json.dumps(progress).encode(),
+                f"job:{job_id}:progress",
+                orjson.dumps(progress),
                 ex=self.TTL_SECONDS
             )
             
-            # Update processed count in metadata
-            meta_raw = self.redis.get(meta_key)
-            if meta_raw:
-                meta = json.loads(meta_raw.decode())
-                meta["processed"] = current
-                meta["status"] = "processing"
-                self.redis.set(
-                    meta_key,
-                    json.dumps(meta).encode(),
-                    ex=self.TTL_SECONDS
-                )
-            
             return True
-        except (redis.ConnectionError, redis.RedisError, json.JSONDecodeError):
+        except (redis.ConnectionError, redis.RedisError):
             return False
     
     def mark_completed(self, job_id: str) -> bool:
         """Mark job as completed with timestamp."""
-        if not self.is_available():
+        if self.redis is None:
             return False
         
         try:
             meta_key = f"job:{job_id}:meta"
-            meta_raw = self.redis.get(meta_key)
+            meta_raw, progress_raw = self.redis.mget(meta_key, f"job:{job_id}:progress")
             
             if not meta_raw:
                 return False
             
-            meta = json.loads(meta_raw.decode())
+            meta = orjson.loads(meta_raw)
+            if progress_raw:
+                meta["processed"] = orjson.loads(progress_raw).get("current", meta["processed"])
             meta["status"] = "completed"
             meta["completed_at"] = datetime.utcnow().isoformat()
             
-            self.redis.set(
-                meta_key,
-                json.dumps(meta).encode(),
-                ex=self.TTL_SECONDS
-            )
+            self._write_final_meta(meta_key, meta)
             
             return True
-        except (redis.ConnectionError, redis.RedisError, json.JSONDecodeError):
+        except (redis.ConnectionError, redis.RedisError, orjson.JSONDecodeError):
             return False
     
     def mark_failed(self, job_id: str, error: str) -> bool:
         """Mark job as failed with error message."""
-        if not self.is_available():
+        if self.redis is None:
             return False
         
         try:
             meta_key = f"job:{job_id}:meta"
-            meta_raw = self.redis.get(meta_key)
+            meta_raw, progress_raw = self.redis.mget(meta_key, f"job:{job_id}:progress")
             
             if not meta_raw:
                 return False
             
-            meta = json.loads(meta_raw.decode())
+            meta = orjson.loads(meta_raw)
+            if progress_raw:
+                meta["processed"] = orjson.loads(progress_raw).get("current", meta["processed"])
             meta["status"] = "failed"
             meta["error"] = error
             meta["completed_at"] = datetime.utcnow().isoformat()
             
-            self.redis.set(
-                meta_key,
-                json.dumps(meta).encode(),
-                ex=self.TTL_SECONDS
-            )
+            self._write_final_meta(meta_key, meta)
             
             return True
-        except (redis.ConnectionError, redis.RedisError, json.JSONDecodeError):
+        except (redis.ConnectionError, redis.RedisError, orjson.JSONDecodeError):
             return False
     
+    def _write_final_meta(self, meta_key: str, meta: dict) -> None:
+        """Store a finished job's metadata and drop it from its user's active set."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.set(meta_key, orjson.dumps(meta), ex=self.TTL_SECONDS)
+        if meta.get("session_id"):  # Older jobs didn't record their session
+            pipe.srem(f"user:{meta['session_id']}:active", meta["id"])
+        pipe.execute()
+
+    def has_active_jobs(self, session_id: str) -> bool:
+        """Check whether a user has pending or processing jobs, in one round-trip."""
+        if self.redis is None:
+            return False
+
+        try:
+            return self.redis.scard(f"user:{session_id}:active") > 0
+        except (redis.ConnectionError, redis.RedisError):
+            return False
+
     def save_results(self, job_id: str, results: list[dict]) -> bool:
-        """Save results (GZIP compressed). Returns True on success."""
-        if not self.is_available():
+        """Save results as a zstd-compressed Parquet table. Returns True on success."""
+        if self.redis is None:
             return False
         
         try:
             results_key = f"job:{job_id}:results"
             
-            # GZIP compress the results
-            json_bytes = json.dumps(results).encode()
-            compressed = gzip.compress(json_bytes)
+            buf = io.BytesIO()
+            pd.DataFrame(results).to_parquet(buf, engine="pyarrow", compression="zstd", index=False)
             
             self.redis.set(
                 results_key,
-                compressed,
+                buf.getvalue(),
                 ex=self.TTL_SECONDS
             )
             
             return True
-        except (redis.ConnectionError, redis.RedisError, json.JSONDecodeError):
+        except (redis.ConnectionError, redis.RedisError, TypeError, ValueError):
             return False
     
+    def save_results_csv(self, job_id: str, results: pd.DataFrame) -> bool:
+        """Save the CSV export of a job's results (zstd compressed). Returns True on success."""
+        if self.redis is None:
+            return False
+
+        try:
+            # Write CSV straight into the compressor so the uncompressed text is never held whole
+            buf = io.BytesIO()
+            with zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(buf, closefd=False) as writer:
+                results.to_csv(writer, index=False, mode="wb", encoding="utf-8")
+
+            self.redis.set(
+                f"job:{job_id}:results_csv",
+                buf.getvalue(),
+                ex=self.TTL_SECONDS
+            )
+            return True
+        except (redis.ConnectionError, redis.RedisError):
+            return False
+
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get job metadata."""
-        if not self.is_available():
+        if self.redis is None:
             return None
         
         try:
-            meta_key = f"job:{job_id}:meta"
-            meta_raw = self.redis.get(meta_key)
+            meta_raw, progress_raw = self.redis.mget(f"job:{job_id}:meta", f"job:{job_id}:progress")
             
             if not meta_raw:
                 return None
             
-            meta = json.loads(meta_raw.decode())
-            
-            return Job(
-                id=meta["id"],
-                status=meta["status"],
-                filename=meta["filename"],
-                total_records=meta["total"],
-                processed_records=meta["processed"],
-                created_at=datetime.fromisoformat(meta["created_at"]),
-                completed_at=datetime.fromisoformat(meta["completed_at"]) if meta.get("completed_at") else None,
-                error_message=meta.get("error")
-            )
-        except (redis.ConnectionError, redis.RedisError, json.JSONDecodeError, KeyError, ValueError):
+            progress = orjson.loads(progress_raw) if progress_raw else None
+            return self._deserialize_job(orjson.loads(meta_raw), progress)
+        except (redis.ConnectionError, redis.RedisError, orjson.JSONDecodeError, KeyError, ValueError):
             return None
+
+    @staticmethod
+    def _deserialize_job(meta: dict, progress: Optional[dict] = None) -> Job:
+        """Build a Job from decoded metadata JSON, overlaying a running job's progress."""
+        status = meta["status"]
+        processed = meta["processed"]
+        if progress and status in ("pending", "processing"):
+            processed = progress.get("current", processed)
+            if status == "pending" and processed:
+                status = "processing"
+
+        return Job(
+            id=meta["id"],
+            status=status,
+            filename=meta["filename"],
+            total_records=meta["total"],
+            processed_records=processed,
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            completed_at=datetime.fromisoformat(meta["completed_at"]) if meta.get("completed_at") else None,
+            error_message=meta.get("error")
+        )
     
-    def get_job_results(self, job_id: str) -> Optional[list[dict]]:
-        """Get job results (decompressed)."""
-        if not self.is_available():
+    def get_job_results(self, job_id: str) -> Optional[pd.DataFrame]:
+        """Get job results as a DataFrame."""
+        if self.redis is None:
             return None
         
         try:
             results_key = f"job:{job_id}:results"
-            compressed = self.redis.get(results_key)
+            raw = self.redis.get(results_key)
             
-            if not compressed:
+            if not raw:
                 return None
             
-            # Decompress and parse
-            json_bytes = gzip.decompress(compressed)
-            results = json.loads(json_bytes.decode())
-            
-            return results
-        except (redis.ConnectionError, redis.RedisError, gzip.BadGzipFile, json.JSONDecodeError):
+            if raw.startswith(b"PAR1"):
+                return pd.read_parquet(io.BytesIO(raw), engine="pyarrow")
+
+            # Jobs saved before results moved to Parquet hold GZIP-compressed JSON
+            return pd.DataFrame(orjson.loads(gzip.decompress(raw)))
+        except (redis.ConnectionError, redis.RedisError, gzip.BadGzipFile, orjson.JSONDecodeError, ValueError):
             return None
     
+    def get_results_csv(self, job_id: str) -> Optional[bytes]:
+        """Get the CSV export of a job's results (decompressed)."""
+        if self.redis is None:
+            return None
+
+        try:
+            compressed = self.redis.get(f"job:{job_id}:results_csv")
+            if not compressed:
+                return None
+            if compressed.startswith(ZSTD_MAGIC):
+                # Streamed frames carry no content size, so use a decompression object
+                return zstandard.ZstdDecompressor().decompressobj().decompress(compressed)
+            return gzip.decompress(compressed)
+        except (redis.ConnectionError, redis.RedisError, gzip.BadGzipFile, zstandard.ZstdError):
+            return None
+
     def get_user_jobs(self, session_id: str) -> list[Job]:
         """Get list of jobs for a user (newest first, max 10)."""
-        if not self.is_available():
+        if self.redis is None:
             return []
         
         try:
-            user_jobs_key = f"user:{session_id}:jobs"
-            job_ids = self.redis.lrange(user_jobs_key, 0, self.MAX_JOBS_PER_USER - 1)
-            
-            jobs = []
-            for job_id_bytes in job_ids:
-                job_id = job_id_bytes.decode() if isinstance(job_id_bytes, bytes) else job_id_bytes
-                job = self.get_job(job_id)
-                if job:
-                    jobs.append(job)
-            
-            return jobs
+            pairs = self.get_jobs_with_progress(self._user_job_ids(session_id))
+            return [job for job, _ in pairs]
+        except (redis.ConnectionError, redis.RedisError):
+            return []
+
+    def get_jobs_with_progress(self, job_ids: list[str]) -> list[tuple[Job, Optional[dict]]]:
+        """Get (job, progress) pairs for job_ids, fetching all keys in one MGET."""
+        if not job_ids or self.redis is None:
+            return []
+
+        try:
+            keys = [f"job:{job_id}:meta" for job_id in job_ids]
+            keys += [f"job:{job_id}:progress" for job_id in job_ids]
+            raws = self.redis.mget(keys)
+
+            pairs = []
+            for meta_raw, progress_raw in zip(raws[:len(job_ids)], raws[len(job_ids):]):
+                try:
+                    progress = orjson.loads(progress_raw) if progress_raw else None
+                except orjson.JSONDecodeError:
+                    progress = None
+                try:
+                    job = self._deserialize_job(orjson.loads(meta_raw), progress)
+                except (TypeError, orjson.JSONDecodeError, KeyError, ValueError):
+                    continue  # Expired or malformed job
+                pairs.append((job, progress))
+
+            return pairs
+        except (redis.ConnectionError, redis.RedisError):
+            return []
+
+    def get_user_jobs_with_progress(self, session_id: str) -> list[tuple[Job, Optional[dict]]]:
+        """Get (job, progress) pairs for a user (newest first, max 10)."""
+        if self.redis is None:
+            return []
+
+        try:
+            return self.get_jobs_with_progress(self._user_job_ids(session_id))
         except (redis.ConnectionError, redis.RedisError):
             return []
+
+    def _user_job_ids(self, session_id: str) -> list[str]:
+        """Get a user's job IDs, newest first."""
+        job_ids = self.redis.lrange(f"user:{session_id}:jobs", 0, self.MAX_JOBS_PER_USER - 1)
+        return [job_id.decode() if isinstance(job_id, bytes) else job_id for job_id in job_ids]
     
     def get_progress(self, job_id: str) -> Optional[dict]:
         """Get current progress for a job."""
-        if not self.is_available():
+        if self.redis is None:
             return None
 
         try:
@@ -311,27 +481,29 @@ class JobManager:
             if not progress_raw:
                 return None
 
-            return json.loads(progress_raw.decode())
-        except (redis.ConnectionError, redis.RedisError, json.JSONDecodeError):
+            return orjson.loads(progress_raw)
+        except (redis.ConnectionError, redis.RedisError, orjson.JSONDecodeError):
             return None
 
     def delete_job(self, job_id: str, session_id: str = None) -> bool:
         """Delete a job and all its associated data from Redis."""
-        if not self.is_available():
+        if self.redis is None:
             return False
 
         try:
             # Delete all job keys
             meta_key = f"job:{job_id}:meta"
             results_key = f"job:{job_id}:results"
+            results_csv_key = f"job:{job_id}:results_csv"
             progress_key = f"job:{job_id}:progress"
 
-            self.redis.delete(meta_key, results_key, progress_key)
+            self.redis.delete(meta_key, results_key, results_csv_key, progress_key)
 
             # Remove from user's job list if session_id provided
             if session_id:
                 user_jobs_key = f"user:{session_id}:jobs"
                 self.redis.lrem(user_jobs_key, 0, job_id)
+                self.redis.srem(f"user:{session_id}:active", job_id)
 
             return True
         except (redis.ConnectionError, redis.RedisError):
@@ -339,7 +511,7 @@ class JobManager:
 
     def delete_all_jobs(self, session_id: str) -> int:
         """Delete all jobs for a session. Returns count of deleted jobs."""
-        if not self.is_available():
+        if self.redis is None:
             return 0
 
         try:
@@ -352,8 +524,8 @@ class JobManager:
                 if self.delete_job(job_id):
                     deleted += 1
 
-            # Clear the user's job list
-            self.redis.delete(user_jobs_key)
+            # Clear the user's job list and active set
+            self.redis.delete(user_jobs_key, f"user:{session_id}:active")
 
             return deleted
         except (redis.ConnectionError, redis.RedisError):
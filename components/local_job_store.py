@@ -0,0 +1,138 @@
+"""
+SQLite-backed job persistence for the API's no-Redis fallback.
+
+Every API worker opens the same database file, so a job uploaded through one
+worker can be started, polled and downloaded through another.
+"""
+
+from datetime import datetime
+from typing import Optional
+import sqlite3
+import uuid
+
+from components.job_manager import Job
+
+
+class LocalJobStore:
+    """
+    Stores jobs in a SQLite database file in WAL mode (readers never block the writer).
+
+    Schema:
+        jobs -> id, session_id, status, filename, total_records, processed_records,
+                created_at, completed_at, error_message,
+                upload_path (parsed upload awaiting processing),
+                results_path (CSV file of enriched results)
+
+    The connection is shared and meant to be used from the event loop thread only.
+    """
+
+    def __init__(self, path: str):
+        """Open (creating if needed) the jobs database at path."""
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                total_records INTEGER NOT NULL,
+                processed_records INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                completed_at TEXT,
+                error_message TEXT,
+                upload_path TEXT,
+                results_path TEXT
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_by_session ON jobs (session_id, created_at)")
+
+    def create_job(self, session_id: str, filename: str, total_records: int, upload_path: str) -> str:
+        """Create a pending job and return its id."""
+        job_id = str(uuid.uuid4())
+        self.conn.execute(
+            "INSERT INTO jobs (id, session_id, status, filename, total_records, created_at, upload_path) "
+            "VALUES (?, ?, 'pending', ?, ?, ?, ?)",
+            (job_id, session_id, filename, total_records, datetime.now().isoformat(), upload_path),
+        )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Get job metadata."""
+        row = self.conn.execute(
+            "SELECT id, status, filename, total_records, processed_records, created_at, completed_at, error_message "
+            "FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def get_user_jobs(self, session_id: str) -> list[Job]:
+        """Get a session's jobs, newest first."""
+        rows = self.conn.execute(
+            "SELECT id, status, filename, total_records, processed_records, created_at, completed_at, error_message "
+            "FROM jobs WHERE session_id = ? ORDER BY created_at DESC",
+            (session_id,),
+        ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def get_upload_path(self, job_id: str) -> Optional[str]:
+        """Get the parsed upload path for a job that has not been processed yet."""
+        row = self.conn.execute("SELECT upload_path FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def get_results_path(self, job_id: str) -> Optional[str]:
+        """Get the results CSV path for a completed job."""
+        row = self.conn.execute("SELECT results_path FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def mark_processing(self, job_id: str) -> None:
+        """Mark job as processing; its upload is now owned by the running task."""
+        self.conn.execute(
+            "UPDATE jobs SET status = 'processing', upload_path = NULL WHERE id = ?",
+            (job_id,),
+        )
+
+    def update_progress(self, job_id: str, current: int) -> None:
+        """Update the processed record count."""
+        self.conn.execute("UPDATE jobs SET processed_records = ? WHERE id = ?", (current, job_id))
+
+    def mark_completed(self, job_id: str, processed_records: int, results_path: str) -> None:
+        """Mark job as completed with its results file and timestamp."""
+        self.conn.execute(
+            "UPDATE jobs SET status = 'completed', processed_records = ?, results_path = ?, completed_at = ? "
+            "WHERE id = ?",
+            (processed_records, results_path, datetime.now().isoformat(), job_id),
+        )
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        """Mark job as failed with error message."""
+        self.conn.execute(
+            "UPDATE jobs SET status = 'failed', error_message = ?, completed_at = ? WHERE id = ?",
+            (error, datetime.now().isoformat(), job_id),
+        )
+
+    def delete_job(self, job_id: str) -> bool:
+        """Delete a job. Returns True if it existed."""
+        return self.conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,)).rowcount > 0
+
+    def delete_all_jobs(self, session_id: str) -> int:
+        """Delete all jobs for a session. Returns count of deleted jobs."""
+        return self.conn.execute("DELETE FROM jobs WHERE session_id = ?", (session_id,)).rowcount
+
+
+def _row_to_job(row: tuple) -> Job:
+    """Build a Job from a jobs row selected in Job field order."""
+    job_id, status, filename, total, processed, created_at, completed_at, error = row
+    return Job(
+        id=job_id,
+        status=status,
+        filename=filename,
+        total_records=total,
+        processed_records=processed,
+        created_at=datetime.fromisoformat(created_at),
+        completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+        error_message=error,
+    )
@@ -5,13 +5,65 @@ with real-time progress updates via Streamlit widgets.
 """
 
 import asyncio
+import threading
+import time
+import weakref
 from typing import Optional
 
 import streamlit as st
 
-from main import process_batch, Config, RestaurantRecord, format_output_row
+from main import process_batch, open_http_session, Config, RestaurantRecord, format_output_row
 from components.job_manager import JobManager
 
+# Minimum seconds between progress updates within the same percent
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+
+class _HttpState:
+    """An event loop and an aiohttp session opened on it, kept in session state.
+
+    Reusing them across reruns keeps pooled API connections alive between
+    batches instead of reconnecting. Both are closed once the state is dropped:
+    when a rerun replaces it, or when the browser session's state is discarded.
+    """
+
+    def __init__(self, batch_size: int):
+        self.loop = asyncio.new_event_loop()
+
+        async def open_session():
+            return open_http_session(batch_size)
+
+        self.session = self.loop.run_until_complete(open_session())
+        # The callback must not reference self, or the state would never be collected
+        weakref.finalize(self, _close_http_state, self.loop, self.session)
+
+
+def _close_http_state(loop: asyncio.AbstractEventLoop, session) -> None:
+    """Close session and then loop, from a thread that isn't running another event loop."""
+    def close() -> None:
+        loop.run_until_complete(session.close())
+        loop.close()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        close()
+    else:
+        # Collected on a thread running its own loop (e.g. Streamlit's server),
+        # where run_until_complete would refuse to start
+        threading.Thread(target=close, daemon=True).start()
+
+
+def _http_state(batch_size: int) -> _HttpState:
+    """Get the event loop and aiohttp session kept in session state, creating them if needed."""
+    state = st.session_state.get("_http_state")
+    # A rerun can start while an interrupted run still holds the old loop; that
+    # run drops its reference when it unwinds, which closes the old state
+    if state is None or state.loop.is_running():
+        state = _HttpState(batch_size)
+        st.session_state["_http_state"] = state
+    return state
+
 
 def run_processing(
     records: list[RestaurantRecord],
@@ -49,6 +101,14 @@ def run_processing(
 
     status_text.text(f"Getting started with {total} records...")
 
+    if job_manager and job_id:
+        job_manager.mark_processing(job_id)
+
+    # Time and percentage of the last widget update; each update sends a frame
+    # to the browser, so they are coalesced to ~10 per second or one per 1%
+    last_update = [0.0]
+    last_pct = [-1]
+
     def progress_callback(current: int, total: int, message: str) -> None:
         """Update Streamlit progress widgets.
 
@@ -57,6 +117,13 @@ def run_processing(
             total: Total number of records.
             message: Status message to display.
         """
+        now = time.monotonic()
+        pct = current * 100 // total if total > 0 else 0
+        if now - last_update[0] < PROGRESS_UPDATE_INTERVAL and pct == last_pct[0] and current != total:
+            return
+        last_update[0] = now
+        last_pct[0] = pct
+
         # Update progress bar (value must be 0.0 to 1.0)
         progress_value = current / total if total > 0 else 0.0
         progress_bar.progress(progress_value)
@@ -69,14 +136,15 @@ def run_processing(
             job_manager.update_progress(job_id, current, total, message)
 
     try:
-        # Run async process_batch using asyncio.run()
-        # This creates a new event loop for the sync context
-        results = asyncio.run(
+        # Run async process_batch on this session's persistent event loop
+        http = _http_state(batch_size)
+        results = http.loop.run_until_complete(
             process_batch(
                 records=records,
                 config=config,
                 batch_size=batch_size,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                session=http.session
             )
         )
 
@@ -5,7 +5,6 @@ Provides functions to render enrichment results as an interactive dataframe
 with summary statistics and CSV download functionality.
 """
 
-import io
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -14,11 +13,27 @@ import streamlit as st
 if TYPE_CHECKING:
     from main import RestaurantRecord
 
-# Import from main module
-from main import RestaurantRecord, format_output_row
 
+def _results_export(results: list["RestaurantRecord"]) -> tuple[pd.DataFrame, bytes]:
+    """Build the output DataFrame and its CSV bytes once per results list.
 
-def render_results(results: list[RestaurantRecord]) -> None:
+    Streamlit reruns the whole script on every interaction, but the results
+    list kept in session state stays the same object, so the export is cached
+    in session state against that object's identity.
+    """
+    cached = st.session_state.get("results_export")
+    if cached is not None and cached[0] is results:
+        return cached[1], cached[2]
+
+    from main import format_output_row
+
+    df = pd.DataFrame([format_output_row(record) for record in results])
+    csv_bytes = df.to_csv(index=False).encode("utf-8")
+    st.session_state.results_export = (results, df, csv_bytes)
+    return df, csv_bytes
+
+
+def render_results(results: list["RestaurantRecord"]) -> None:
     """Render enrichment results as an interactive dataframe with summary stats.
     
     Converts results to DataFrame using format_output_row and displays:
@@ -34,32 +49,27 @@ def render_results(results: list[RestaurantRecord]) -> None:
         return
     
     # Convert results to DataFrame using existing format_output_row function
-    output_rows = [format_output_row(record) for record in results]
-    df = pd.DataFrame(output_rows)
+    df, _ = _results_export(results)
     
     # Calculate summary statistics
     total = len(results)
     
-    # Owners Found: count records with at least one owner
-    owners_found = sum(1 for r in results if r.owners)
-    
-    # Names Resolved: count where restaurant_name differs from llc_name
-    names_resolved = sum(
-        1 for r in results 
-        if r.restaurant_name and r.llc_name and r.restaurant_name != r.llc_name
-    )
-    
-    # Whitepages Enriched: count records with personal_phone from Whitepages
-    whitepages_enriched = sum(
-        1 for r in results 
-        if r.owners and any(o.personal_phone for o in r.owners)
-    )
-    
-    # CSV Matched: count records where owner source contains "csv"
-    csv_matched = sum(
-        1 for r in results 
-        if r.owners and any("csv" in o.source.lower() for o in r.owners)
-    )
+    # Count all four summary stats in a single pass over the results
+    owners_found = names_resolved = whitepages_enriched = csv_matched = 0
+    for r in results:
+        # Names Resolved: restaurant_name differs from llc_name
+        if r.restaurant_name and r.llc_name and r.restaurant_name != r.llc_name:
+            names_resolved += 1
+        if not r.owners:
+            continue
+        # Owners Found: at least one owner
+        owners_found += 1
+        # Whitepages Enriched: an owner has personal_phone from Whitepages
+        if any(o.personal_phone for o in r.owners):
+            whitepages_enriched += 1
+        # CSV Matched: an owner source contains "csv"
+        if any("csv" in o.source.lower() for o in r.owners):
+            csv_matched += 1
     
     # Display header with encouraging message
     st.subheader("Here's what we found!")
@@ -111,7 +121,7 @@ def render_results(results: list[RestaurantRecord]) -> None:
     )
 
 
-def render_download_button(results: list[RestaurantRecord]) -> None:
+def render_download_button(results: list["RestaurantRecord"]) -> None:
     """Render a download button for exporting results as CSV.
     
     Creates CSV bytes from results using format_output_row and provides
@@ -124,14 +134,8 @@ def render_download_button(results: list[RestaurantRecord]) -> None:
         st.warning("No results available for download yet.")
         return
     
-    # Convert results to DataFrame
-    output_rows = [format_output_row(record) for record in results]
-    df = pd.DataFrame(output_rows)
-    
-    # Convert to CSV bytes
-    csv_buffer = io.StringIO()
-    df.to_csv(csv_buffer, index=False)
-    csv_bytes = csv_buffer.getvalue().encode("utf-8")
+    # Reuse the CSV bytes built alongside the results table
+    _, csv_bytes = _results_export(results)
     
     st.write("Your enriched leads are ready! Click below to download.")
     
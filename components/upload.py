@@ -1,8 +1,12 @@
 """CSV upload and validation component for Streamlit app."""
 
+import hashlib
+import io
 from typing import Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 
 
@@ -21,7 +25,7 @@ def render_upload_section() -> Optional[pd.DataFrame]:
     """Render file upload section and return uploaded DataFrame.
 
     Uses st.file_uploader with CSV and Excel support (.csv, .xlsx, .xls).
-    Reads uploaded file into pandas DataFrame and stores in session state.
+    Reads uploaded file into pandas DataFrame, cached on the file contents.
 
     Returns:
         DataFrame if file uploaded successfully, None otherwise.
@@ -38,19 +42,12 @@ def render_upload_section() -> Optional[pd.DataFrame]:
     if uploaded_file is None:
         return None
 
+    if not uploaded_file.name.endswith((".csv", ".xlsx", ".xls")):
+        st.error(f"Hmm, we don't recognize this file type: {uploaded_file.name}")
+        return None
+
     try:
-        # Read file based on extension
-        if uploaded_file.name.endswith(".csv"):
-            df = pd.read_csv(uploaded_file)
-        elif uploaded_file.name.endswith((".xlsx", ".xls")):
-            df = pd.read_excel(uploaded_file)
-        else:
-            st.error(f"Hmm, we don't recognize this file type: {uploaded_file.name}")
-            return None
-
-        # Store in session state for access by other components
-        st.session_state.uploaded_df = df
-        return df
+        return _parse_upload(uploaded_file.getvalue(), uploaded_file.name)
 
     except pd.errors.EmptyDataError:
         st.error("This file appears to be empty. Please try another one.")
@@ -63,6 +60,41 @@ def render_upload_section() -> Optional[pd.DataFrame]:
         return None
 
 
+@st.cache_data(show_spinner="Parsing file...", max_entries=4)
+def _parse_upload(file_bytes: bytes, filename: str) -> pd.DataFrame:
+    """Parse uploaded file bytes into a DataFrame, cached so reruns skip the parse.
+
+    The DataFrame's attrs["upload_key"] identifies the upload for caching
+    derived values such as the preview stats.
+    """
+    # Read file based on extension (Arrow-backed dtypes keep strings compact)
+    if filename.endswith(".csv"):
+        df = _read_csv(io.BytesIO(file_bytes))
+    else:
+        from main import read_excel  # main is imported lazily (see app.py)
+
+        df = read_excel(io.BytesIO(file_bytes))
+
+    df.attrs["upload_key"] = f"{filename}:{hashlib.blake2b(file_bytes, digest_size=16).hexdigest()}"
+    return df
+
+
+def _read_csv(uploaded_file) -> pd.DataFrame:
+    """Read an uploaded CSV with pyarrow's multithreaded parser, falling back to pandas."""
+    try:
+        table = pacsv.read_csv(
+            uploaded_file,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    except pa.ArrowInvalid:
+        # Empty files, or a column whose type changes after the first block;
+        # pandas copes with the latter and reports the former as EmptyDataError
+        uploaded_file.seek(0)
+        return pd.read_csv(uploaded_file, dtype_backend="pyarrow")
+
+
 def validate_csv(df: pd.DataFrame) -> tuple[bool, str]:
     """Validate that the uploaded DataFrame has required columns.
 
@@ -81,22 +113,16 @@ def validate_csv(df: pd.DataFrame) -> tuple[bool, str]:
         return False, "The file appears to be empty. Please check and try again."
 
     # Normalize column names for case-insensitive comparison
-    df_columns_lower = [col.lower().strip() for col in df.columns]
+    df_columns_lower = {col.lower().strip() for col in df.columns}
 
     # Check required columns
-    missing_required = []
-    for col in REQUIRED_COLUMNS:
-        if col.lower() not in df_columns_lower:
-            missing_required.append(col)
+    missing_required = [col for col in REQUIRED_COLUMNS if col.lower() not in df_columns_lower]
 
     if missing_required:
         return False, f"We need a '{', '.join(missing_required)}' column to proceed. Please add it and try again."
 
     # Check recommended columns
-    missing_recommended = []
-    for col in RECOMMENDED_COLUMNS:
-        if col.lower() not in df_columns_lower:
-            missing_recommended.append(col)
+    missing_recommended = [col for col in RECOMMENDED_COLUMNS if col.lower() not in df_columns_lower]
 
     if missing_recommended:
         return True, f"Warning: Your file is missing {', '.join(missing_recommended)} columns. We can still work with it, but results may be more limited."
@@ -107,7 +133,7 @@ def validate_csv(df: pd.DataFrame) -> tuple[bool, str]:
 def render_preview(df: pd.DataFrame) -> None:
     """Render a preview of the uploaded DataFrame with metrics.
 
-    Shows first 10 rows and displays key metrics like total records,
+    Shows the first 10 rows of the expected columns and key metrics like total records,
     column count, and data quality indicators.
 
     Args:
@@ -119,6 +145,9 @@ def render_preview(df: pd.DataFrame) -> None:
 
     st.subheader("Here's what you uploaded")
 
+    upload_key = df.attrs.get("upload_key")
+    stats = _cached_preview_stats(upload_key, df) if upload_key else _preview_stats(df)
+
     # Display metrics in columns
     col1, col2, col3, col4 = st.columns(4)
 
@@ -129,52 +158,75 @@ def render_preview(df: pd.DataFrame) -> None:
         st.metric("Data Columns", len(df.columns))
 
     with col3:
-        # Count records with coordinates (useful for Google Places lookup)
-        if "lat" in df.columns and "long" in df.columns:
-            coords_count = df[["lat", "long"]].dropna().shape[0]
-        else:
-            coords_count = 0
-        st.metric("Have Coordinates", f"{coords_count:,}")
+        st.metric("Have Coordinates", f"{stats['coords_count']:,}")
 
     with col4:
-        # Count non-empty name values
-        if "name" in df.columns:
-            name_count = df["name"].notna().sum()
-        else:
-            name_count = 0
-        st.metric("Have Names", f"{name_count:,}")
+        st.metric("Have Names", f"{stats['name_count']:,}")
 
     # Show column list
     with st.expander("See all columns in your file"):
         st.write(", ".join(df.columns.tolist()))
 
-    # Show first 10 rows
-    st.dataframe(df.head(10))
+    # Show first 10 rows of the columns the enrichment reads (all columns if it
+    # reads none of them), so only that slice is sent to the browser
+    preview_cols = [c for c in ALL_EXPECTED_COLUMNS if c in df.columns] or list(df.columns)
+    st.dataframe(df.iloc[:10][preview_cols], hide_index=True)
 
     # Data quality summary
     st.markdown("**A quick look at your data quality:**")
     quality_col1, quality_col2 = st.columns(2)
 
     with quality_col1:
-        # Check for contact columns
-        contact_cols = [c for c in df.columns if c.lower().startswith(("name", "phone", "email"))]
-        st.write(f"- Contact columns found: {len(contact_cols)}")
-
-        # Count records with any phone
-        phone_cols = [c for c in df.columns if "phone" in c.lower()]
-        if phone_cols:
-            has_phone = df[phone_cols].notna().any(axis=1).sum()
-            st.write(f"- Records with phone numbers: {has_phone:,}")
+        st.write(f"- Contact columns found: {stats['contact_cols']}")
+        if stats["has_phone"] is not None:
+            st.write(f"- Records with phone numbers: {stats['has_phone']:,}")
 
     with quality_col2:
-        # Count records with address info
-        address_cols = ["address", "city", "state", "zip"]
-        present_addr_cols = [c for c in address_cols if c in df.columns]
-        if present_addr_cols:
-            has_address = df[present_addr_cols].notna().all(axis=1).sum()
-            st.write(f"- Records with full address: {has_address:,}")
-
-        # Count records with website
-        if "website" in df.columns:
-            has_website = df["website"].notna().sum()
-            st.write(f"- Records with website: {has_website:,}")
+        if stats["has_address"] is not None:
+            st.write(f"- Records with full address: {stats['has_address']:,}")
+        if stats["has_website"] is not None:
+            st.write(f"- Records with website: {stats['has_website']:,}")
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_preview_stats(upload_key: str, _df: pd.DataFrame) -> dict:
+    """_preview_stats, cached per upload (the DataFrame itself is not hashed)."""
+    return _preview_stats(_df)
+
+
+def _preview_stats(df: pd.DataFrame) -> dict:
+    """Count the data-quality indicators shown by render_preview.
+
+    Counts for columns the file doesn't have are None (0 for coordinates and names).
+    """
+    stats = {}
+    phone_cols = [c for c in df.columns if "phone" in c.lower()]
+    present_addr_cols = [c for c in ["address", "city", "state", "zip"] if c in df.columns]
+
+    # One notna pass over every column the counts below look at
+    interest_cols = [c for c in ["lat", "long", "name", "website"] if c in df.columns]
+    interest_cols += [c for c in present_addr_cols + phone_cols if c not in interest_cols]
+    mask = df[interest_cols].notna()
+
+    # Count records with coordinates (useful for Google Places lookup)
+    if "lat" in mask.columns and "long" in mask.columns:
+        stats["coords_count"] = int(mask[["lat", "long"]].all(axis=1).sum())
+    else:
+        stats["coords_count"] = 0
+
+    # Count non-empty name values
+    stats["name_count"] = int(mask["name"].sum()) if "name" in mask.columns else 0
+
+    # Check for contact columns
+    stats["contact_cols"] = len([c for c in df.columns if c.lower().startswith(("name", "phone", "email"))])
+
+    # Count records with any phone
+    stats["has_phone"] = int(mask[phone_cols].any(axis=1).sum()) if phone_cols else None
+
+    # Count records with address info
+    stats["has_address"] = int(mask[present_addr_cols].all(axis=1).sum()) if present_addr_cols else None
+
+    # Count records with website
+    stats["has_website"] = int(mask["website"].sum()) if "website" in mask.columns else None
+
+    return stats
@@ -6,33 +6,52 @@ Processes restaurant business CSV files, finds actual restaurant names (DBA) fro
 identifies owners via Perplexity (through OpenRouter), and matches against existing contacts.
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import csv
+import functools
 import hashlib
 import json
+import logging
 import os
 import re
+import sqlite3
 import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Mapping, Optional
 
-import aiohttp
+import orjson
 import pandas as pd
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
-from openai import AsyncOpenAI
-from rapidfuzz import fuzz
 from tenacity import retry, stop_after_attempt, wait_exponential
-from tqdm.asyncio import tqdm_asyncio
-from tqdm import tqdm
+
+from cleaning import clean_fein, clean_str, extract_dba_from_name, is_missing
+
+# aiohttp, openai, pyarrow, rapidfuzz and tqdm are imported where they're used, so that
+# importing this module (e.g. from the Streamlit components) stays cheap
+if TYPE_CHECKING:
+    import aiohttp
 
 
+logger = logging.getLogger(__name__)
+
 # Global verbose flag for debugging
 VERBOSE = False
 
+# Total seconds allowed for each API request
+HTTP_TIMEOUT_SECONDS = 30
+
+# Records process_batch schedules at a time
+GATHER_CHUNK_SIZE = 500
+
 
 def log_verbose(msg: str) -> None:
     """Print message if verbose mode is enabled."""
@@ -93,6 +112,8 @@ def handle_api_error(e: Exception, api_name: str) -> None:
         NetworkError: When connection-level errors occur.
         APIError: For other API-related errors.
     """
+    import aiohttp
+
     error_msg = str(e)
     
     # Handle aiohttp-specific exceptions
@@ -170,12 +191,38 @@ async def api_request_with_fallback(
     return None
 
 
+def coalesce_inflight(method: Callable) -> Callable:
+    """Decorator for API client methods: concurrent identical calls share one request.
+
+    Calls are identical when their plain (str/number/None) arguments match; other
+    arguments such as the aiohttp session are ignored. Later callers await the
+    first call's task and get its result or exception. Expects self._inflight.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        plain = (str, int, float, type(None))
+        key = (
+            method.__name__,
+            tuple(a for a in args if isinstance(a, plain)),
+            tuple(sorted((k, v) for k, v in kwargs.items() if isinstance(v, plain))),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel the others' request
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
 # ============================================================================
 # Configuration & Data Classes
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration from environment variables."""
     google_places_api_key: str = field(default_factory=lambda: os.getenv("GOOGLE_PLACES_API_KEY", ""))
@@ -183,6 +230,8 @@ class Config:
     whitepages_api_key: str = field(default_factory=lambda: os.getenv("WHITEPAGES_API_KEY", ""))
     yelp_api_key: str = field(default_factory=lambda: os.getenv("YELP_API_KEY", ""))
     cache_dir: Path = field(default_factory=lambda: Path(".cache"))
+    # Take the owner straight from the CSV when a listed person has a phone, skipping the owner search
+    csv_only_when_sufficient: bool = False
 
     def __post_init__(self):
         self.cache_dir.mkdir(exist_ok=True)
@@ -213,7 +262,13 @@ class Config:
             print("Additional data sources will be skipped.")
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, built from the environment on first use."""
+    return Config()
+
+
+@dataclass(slots=True)
 class PersonInfo:
     """Person contact information."""
     name: str
@@ -227,6 +282,11 @@ class PersonInfo:
     personal_zip: Optional[str] = None
     personal_phone: Optional[str] = None  # Owner's personal phone (may differ from CSV match)
     personal_email: Optional[str] = None  # Owner's personal email
+    # Lowercased, stripped name for fuzzy matching (derived from name)
+    name_norm: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.name_norm = self.name.lower().strip()
 
 
 @dataclass
@@ -241,7 +301,7 @@ class OwnerResult:
         return f"{self.name} (confidence={self.confidence:.2f}, strategy={self.strategy})"
 
 
-@dataclass
+@dataclass(slots=True)
 class RestaurantRecord:
     """Processed restaurant record."""
     fein: str = ""
@@ -267,38 +327,120 @@ class RestaurantRecord:
 # ============================================================================
 
 class CacheManager:
-    """Simple file-based cache for API responses."""
+    """SQLite-backed cache for API responses, fronted by an in-memory LRU.
+
+    Entries live in one key/value table in cache_dir/cache.db (WAL mode) rather
+    than one JSON file each. The database connection and the in-memory tier are
+    shared by every CacheManager in the process, so repeated keys skip the
+    database even across batches. Writes go to both tiers.
+    """
+
+    MEMORY_CACHE_SIZE = 50_000  # Max entries held in memory
+
+    _mem: OrderedDict[tuple[Path, str], dict] = OrderedDict()
+    _mem_lock = threading.Lock()  # Streamlit sessions process batches on separate threads
+    _connections: dict[Path, sqlite3.Connection] = {}
+    _db_lock = threading.Lock()
 
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(exist_ok=True)
+        self.db_path = cache_dir / "cache.db"
+
+        with self._db_lock:
+            conn = self._connections.get(self.db_path)
+            if conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None, timeout=5)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+                self._connections[self.db_path] = conn
+        self.conn = conn
 
     def _get_cache_key(self, prefix: str, *args) -> str:
         """Generate a cache key from arguments."""
+        key_data = ":".join((prefix, *map(str, args))).encode()
+        return hashlib.blake2b(key_data, digest_size=16).hexdigest()
+
+    def _get_legacy_cache_key(self, prefix: str, *args) -> str:
+        """Generate the MD5 cache key used before keys moved to BLAKE2b."""
         key_data = f"{prefix}:{':'.join(str(a) for a in args)}"
         return hashlib.md5(key_data.encode()).hexdigest()
 
-    def _get_cache_path(self, key: str) -> Path:
-        return self.cache_dir / f"{key}.json"
+    def _remember(self, key: str, value: dict) -> None:
+        """Store value in the in-memory tier, evicting the least recently used entry."""
+        mem_key = (self.db_path, key)
+        with self._mem_lock:
+            self._mem[mem_key] = value
+            self._mem.move_to_end(mem_key)
+            if len(self._mem) > self.MEMORY_CACHE_SIZE:
+                self._mem.popitem(last=False)
+
+    def _store(self, key: str, raw: bytes) -> None:
+        """Write an encoded entry to the database."""
+        with self._db_lock:
+            self.conn.execute("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", (key, raw))
+
+    def _adopt_file_entry(self, key: str, prefix: str, *args) -> Optional[dict]:
+        """Move an entry cached as a JSON file (before the database) into the database."""
+        for name in (key, self._get_legacy_cache_key(prefix, *args)):
+            path = self.cache_dir / f"{name}.json"
+            if not path.exists():
+                continue
+            try:
+                raw = path.read_bytes()
+                value = orjson.loads(raw)
+            except (orjson.JSONDecodeError, IOError):
+                return None
+            self._store(key, raw)
+            path.unlink(missing_ok=True)
+            return value
+        return None
 
     def get(self, prefix: str, *args) -> Optional[dict]:
         """Get cached value if exists."""
         key = self._get_cache_key(prefix, *args)
-        path = self._get_cache_path(key)
-        if path.exists():
+        mem_key = (self.db_path, key)
+        with self._mem_lock:
+            value = self._mem.get(mem_key)
+            if value is not None:
+                self._mem.move_to_end(mem_key)
+                return value
+
+        with self._db_lock:
+            row = self.conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            # Existing file caches stay warm: their entries move over on first use
+            value = self._adopt_file_entry(key, prefix, *args)
+            if value is None:
+                return None
+        else:
             try:
-                with open(path) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                value = orjson.loads(row[0])
+            except orjson.JSONDecodeError:
                 return None
-        return None
+        self._remember(key, value)
+        return value
 
     def set(self, prefix: str, *args, value: dict):
         """Cache a value."""
         key = self._get_cache_key(prefix, *args)
-        path = self._get_cache_path(key)
-        with open(path, "w") as f:
-            json.dump(value, f)
+        self._store(key, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+        self._remember(key, value)
+
+    async def aget(self, prefix: str, *args) -> Optional[dict]:
+        """get() for async callers: in-memory hits return directly, database reads run in a thread."""
+        mem_key = (self.db_path, self._get_cache_key(prefix, *args))
+        with self._mem_lock:
+            value = self._mem.get(mem_key)
+            if value is not None:
+                self._mem.move_to_end(mem_key)
+                return value
+        return await asyncio.to_thread(self.get, prefix, *args)
+
+    async def aset(self, prefix: str, *args, value: dict):
+        """set() for async callers, writing to the database in a thread."""
+        await asyncio.to_thread(self.set, prefix, *args, value=value)
 
 
 # ============================================================================
@@ -347,6 +489,8 @@ class GooglePlacesClient:
         Returns:
             dict with 'name', 'place_id', 'address' or None if not found
         """
+        import aiohttp
+
         if not self.api_key:
             return None
         
@@ -364,7 +508,7 @@ class GooglePlacesClient:
         text_query = " ".join(query_parts)
 
         # Check cache first
-        cached = self.cache.get("google_text_search", text_query)
+        cached = await self.cache.aget("google_text_search", text_query)
         if cached:
             return cached
 
@@ -402,7 +546,7 @@ class GooglePlacesClient:
                 if resp.status != 200:
                     # Log non-200 responses for debugging
                     error_text = await resp.text()
-                    print(f"Google Text Search API error {resp.status}: {error_text[:200]}")
+                    logger.warning("Google Text Search API error %s: %s", resp.status, error_text[:200])
                     return None
                 
                 data = await resp.json()
@@ -417,11 +561,11 @@ class GooglePlacesClient:
                         "address": first_place.get("formattedAddress")
                     }
                     if result["name"]:
-                        self.cache.set("google_text_search", text_query, value=result)
+                        await self.cache.aset("google_text_search", text_query, value=result)
                         return result
 
         except aiohttp.ClientError as e:
-            print(f"Google Text Search request failed: {e}")
+            logger.warning("Google Text Search request failed: %s", e)
             raise  # Let retry decorator handle it
 
         return None
@@ -451,7 +595,7 @@ class GooglePlacesClient:
             return None
 
         # Check cache first
-        cached = self.cache.get("google_nearby", lat, lng, radius)
+        cached = await self.cache.aget("google_nearby", lat, lng, radius)
         if cached:
             return cached
 
@@ -473,7 +617,7 @@ class GooglePlacesClient:
                     "place_id": data["results"][0].get("place_id"),
                     "address": data["results"][0].get("vicinity")
                 }
-                self.cache.set("google_nearby", lat, lng, radius, value=result)
+                await self.cache.aset("google_nearby", lat, lng, radius, value=result)
                 return result
 
         return None
@@ -567,6 +711,8 @@ class YelpClient:
                 "phone": str      # Business phone number
             }
         """
+        import aiohttp
+
         if not self.api_key:
             log_verbose("[Yelp] No API key configured - skipping search")
             return None
@@ -580,7 +726,7 @@ class YelpClient:
 
         # Check cache first - normalize cache key
         cache_key = f"{llc_name.lower().strip()}:{location.lower().strip()}"
-        cached = self.cache.get("yelp_search", cache_key)
+        cached = await self.cache.aget("yelp_search", cache_key)
         if cached:
             log_verbose(f"[Yelp] Cache hit for {llc_name}")
             return cached
@@ -662,7 +808,7 @@ class YelpClient:
                 log_verbose(f"[Yelp] Found: {result['name']} at {result['address']}")
 
                 # Cache the result
-                self.cache.set("yelp_search", cache_key, value=result)
+                await self.cache.aset("yelp_search", cache_key, value=result)
                 return result
 
         except aiohttp.ClientError as e:
@@ -675,19 +821,28 @@ class YelpClient:
             return None
 
 
+# Patterns used to clean and parse Perplexity responses
+_RE_CODE_FENCE = re.compile(r'```(?:json|JSON)?\s*')
+_RE_STARS = re.compile(r'\*+')
+_RE_CITE = re.compile(r'\[\d+\]')
+_RE_BRACKETS = re.compile(r'\s*\[[\d,\s]+\]\s*')
+_RE_JSON_ARRAY = re.compile(r'\[([^\]]*)\]')
+_RE_BULLET = re.compile(r'^[\d\.\-\*\•]+\s*', re.MULTILINE)
+_RE_PAREN = re.compile(r'\s*[\(\[].*?[\)\]]')
+
+
 def clean_perplexity_text(text: str) -> str:
     """Clean Perplexity response text by removing markdown and citations."""
     if not text:
         return ""
     # Remove markdown code blocks (```json ... ``` or ``` ... ```)
-    text = re.sub(r'```(?:json|JSON)?\s*', '', text)
-    text = re.sub(r'```', '', text)
+    text = _RE_CODE_FENCE.sub('', text)
     # Remove markdown bold/italic
-    text = re.sub(r'\*+', '', text)
+    text = _RE_STARS.sub('', text)
     # Remove citation references like [1], [2][3], etc.
-    text = re.sub(r'\[\d+\]', '', text)
+    text = _RE_CITE.sub('', text)
     # Remove any remaining brackets with numbers
-    text = re.sub(r'\s*\[[\d,\s]+\]\s*', '', text)
+    text = _RE_BRACKETS.sub('', text)
     # Clean up extra whitespace
     text = ' '.join(text.split())
     return text.strip()
@@ -699,12 +854,22 @@ class PerplexityClient:
     def __init__(self, api_key: str, cache: CacheManager):
         self.api_key = api_key
         self.cache = cache
+        self._inflight: dict[tuple, asyncio.Future] = {}  # Requests in progress, for coalesce_inflight
+
+    @functools.cached_property
+    def client(self):
+        """AsyncOpenAI client, built on the first request that misses the cache (None without a key)."""
+        if not self.api_key:
+            return None
+        from openai import AsyncOpenAI
+
         # Use OpenRouter to access Perplexity models
-        self.client = AsyncOpenAI(
-            api_key=api_key,
+        return AsyncOpenAI(
+            api_key=self.api_key,
             base_url="https://openrouter.ai/api/v1"
-        ) if api_key else None
+        )
 
+    @coalesce_inflight
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def resolve_restaurant_name(
         self,
@@ -720,11 +885,11 @@ class PerplexityClient:
         Uses a restaurant identification specialist prompt to find the actual
         restaurant name (DBA name) based on the provided LLC/business name and location information. Many restaurants operate under a different name than their legal LLC name.
         """
-        if not self.client:
+        if not self.api_key:
             return None
 
         cache_key = f"{llc_name}:{address}:{city}:{state}"
-        cached = self.cache.get("perplexity_name", cache_key)
+        cached = await self.cache.aget("perplexity_name", cache_key)
         if cached:
             return cached.get("name")
 
@@ -779,15 +944,16 @@ Search for the actual business name that customers would see at {address}, {city
 
             # Validate: reasonable length for a restaurant name (2-50 chars)
             if name and 2 <= len(name) <= 50 and name.upper() != "UNKNOWN":
-                self.cache.set("perplexity_name", cache_key, value={"name": name})
+                await self.cache.aset("perplexity_name", cache_key, value={"name": name})
                 return name
 
             log_verbose(f"  Perplexity returned invalid name: '{name[:100]}...'")
         except Exception as e:
-            print(f"Perplexity error resolving name for {llc_name}: {e}")
+            logger.warning("Perplexity error resolving name for %s: %s", llc_name, e)
 
         return None
 
+    @coalesce_inflight
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def find_owners(
         self,
@@ -803,11 +969,11 @@ Search for the actual business name that customers would see at {address}, {city
         Uses a restaurant ownership research assistant prompt to find current
         owners. Returns results as a list of owner names parsed from JSON array.
         """
-        if not self.client:
+        if not self.api_key:
             return []
 
         cache_key = f"{restaurant_name}:{llc_name}:{city}:{state}"
-        cached = self.cache.get("perplexity_owners", cache_key)
+        cached = await self.cache.aget("perplexity_owners", cache_key)
         if cached:
             return cached.get("owners", [])
 
@@ -853,11 +1019,11 @@ Example response formats:
             # Parse JSON array response
             owners = self._parse_owners_response(content)
             
-            self.cache.set("perplexity_owners", cache_key, value={"owners": owners})
+            await self.cache.aset("perplexity_owners", cache_key, value={"owners": owners})
             return owners
 
         except Exception as e:
-            print(f"Perplexity error finding owners for {restaurant_name}: {e}")
+            logger.warning("Perplexity error finding owners for %s: %s", restaurant_name, e)
 
         return []
 
@@ -949,6 +1115,7 @@ Example response formats:
         
         return all_results
 
+    @coalesce_inflight
     async def _find_owners_primary(
         self,
         restaurant_name: str,
@@ -960,11 +1127,11 @@ Example response formats:
     ) -> list[str]:
         """Primary strategy: Who owns this restaurant? (existing logic)"""
         # This is essentially the existing find_owners() logic
-        if not self.client:
+        if not self.api_key:
             return []
 
         cache_key = f"primary:{restaurant_name}:{llc_name}:{city}:{state}"
-        cached = self.cache.get("perplexity_owners_multi", cache_key)
+        cached = await self.cache.aget("perplexity_owners_multi", cache_key)
         if cached:
             return cached.get("owners", [])
 
@@ -1005,12 +1172,13 @@ Example response formats:
             content = response.choices[0].message.content.strip()
             content = clean_perplexity_text(content)
             owners = self._parse_owners_response(content)
-            self.cache.set("perplexity_owners_multi", cache_key, value={"owners": owners})
+            await self.cache.aset("perplexity_owners_multi", cache_key, value={"owners": owners})
             return owners
         except Exception as e:
-            print(f"Perplexity error (primary strategy) for {restaurant_name}: {e}")
+            logger.warning("Perplexity error (primary strategy) for %s: %s", restaurant_name, e)
         return []
 
+    @coalesce_inflight
     async def _find_owners_founder(
         self,
         restaurant_name: str,
@@ -1018,11 +1186,11 @@ Example response formats:
         state: str
     ) -> list[str]:
         """Alternative strategy: Who founded this restaurant?"""
-        if not self.client:
+        if not self.api_key:
             return []
 
         cache_key = f"founder:{restaurant_name}:{city}:{state}"
-        cached = self.cache.get("perplexity_owners_multi", cache_key)
+        cached = await self.cache.aget("perplexity_owners_multi", cache_key)
         if cached:
             return cached.get("owners", [])
 
@@ -1056,23 +1224,24 @@ Example response formats:
             content = response.choices[0].message.content.strip()
             content = clean_perplexity_text(content)
             owners = self._parse_owners_response(content)
-            self.cache.set("perplexity_owners_multi", cache_key, value={"owners": owners})
+            await self.cache.aset("perplexity_owners_multi", cache_key, value={"owners": owners})
             return owners
         except Exception as e:
             log_verbose(f"  Perplexity error (founder strategy) for {restaurant_name}: {e}")
         return []
 
+    @coalesce_inflight
     async def _find_owners_llc(
         self,
         llc_name: str,
         state: str
     ) -> list[str]:
         """LLC lookup strategy: Who are the principals/members of the LLC?"""
-        if not self.client:
+        if not self.api_key:
             return []
 
         cache_key = f"llc:{llc_name}:{state}"
-        cached = self.cache.get("perplexity_owners_multi", cache_key)
+        cached = await self.cache.aget("perplexity_owners_multi", cache_key)
         if cached:
             return cached.get("owners", [])
 
@@ -1107,7 +1276,7 @@ Example response formats:
             content = response.choices[0].message.content.strip()
             content = clean_perplexity_text(content)
             owners = self._parse_owners_response(content)
-            self.cache.set("perplexity_owners_multi", cache_key, value={"owners": owners})
+            await self.cache.aset("perplexity_owners_multi", cache_key, value={"owners": owners})
             return owners
         except Exception as e:
             log_verbose(f"  Perplexity error (LLC strategy) for {llc_name}: {e}")
@@ -1140,7 +1309,7 @@ Example response formats:
             pass
         
         # Strategy 2: Extract JSON array from text using regex
-        json_match = re.search(r'\[([^\]]*)\]', content)
+        json_match = _RE_JSON_ARRAY.search(content)
         if json_match:
             try:
                 json_str = '[' + json_match.group(1) + ']'
@@ -1156,12 +1325,12 @@ Example response formats:
         
         # Strategy 3: Fallback to text parsing (legacy behavior)
         # Remove bullets/numbers
-        content = re.sub(r'^[\d\.\-\*\•]+\s*', '', content, flags=re.MULTILINE)
+        content = _RE_BULLET.sub('', content)
         
         # Split by common delimiters
         for line in content.split("\n"):
             line = line.strip()
-            line = re.sub(r'\s*[\(\[].*?[\)\]]', '', line)  # Remove parenthetical info
+            line = _RE_PAREN.sub('', line)  # Remove parenthetical info
             
             if self._is_valid_owner_name(line):
                 owners.append(line)
@@ -1192,6 +1361,18 @@ Example response formats:
         return True
 
 
+# Whitepages full address ("street city, ST zip") and its street/city split
+_RE_CITY_STATE_ZIP = re.compile(r'^(.+),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)$')
+_RE_STREET_CITY = re.compile(
+    r'^(.+?\s+(?:St|Ave|Rd|Dr|Blvd|Ln|Ct|Way|Pl|Cir|Ter|Pkwy|Hwy|Loop|Trl|Run|Pass|Cv)\.?)\s+(.+)$',
+    re.IGNORECASE
+)
+
+
+# Cached in place of a Whitepages result when the lookup found nobody
+WHITEPAGES_MISS = {"__miss__": True}
+
+
 class WhitepagesClient:
     """Whitepages API client for owner personal information lookup.
 
@@ -1210,7 +1391,9 @@ class WhitepagesClient:
         self.api_key = api_key
         self.cache = cache
         self.base_url = "https://api.whitepages.com/v1/person/"
+        self._inflight: dict[tuple, asyncio.Future] = {}  # Requests in progress, for coalesce_inflight
 
+    @coalesce_inflight
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def lookup_person(
         self,
@@ -1238,19 +1421,24 @@ class WhitepagesClient:
                 "personal_email": str
             }
         """
+        import aiohttp
+
         if not self.api_key:
-            print("[Whitepages] No API key configured - skipping lookup")
+            logger.debug("[Whitepages] No API key configured - skipping lookup")
             return None
 
         if not name or not city or not state:
-            print(f"[Whitepages] Missing required params: name={name}, city={city}, state={state}")
+            logger.debug("[Whitepages] Missing required params: name=%s, city=%s, state=%s", name, city, state)
             return None
 
         # Check cache first - use normalized cache key
         cache_key = f"{name.lower().strip()}:{city.lower().strip()}:{state.upper().strip()}"
-        cached = self.cache.get("whitepages_person", cache_key)
+        cached = await self.cache.aget("whitepages_person", cache_key)
         if cached:
-            print(f"[Whitepages] Cache hit for {name}")
+            if cached.get("__miss__"):
+                logger.debug("[Whitepages] Cached miss for %s", name)
+                return None
+            logger.debug("[Whitepages] Cache hit for %s", name)
             return cached
 
         # Query parameters - API only supports 'name' parameter
@@ -1264,27 +1452,29 @@ class WhitepagesClient:
             "X-Api-Key": self.api_key
         }
 
-        print(f"[Whitepages] Looking up: {name} in {city}, {state}")
+        logger.debug("[Whitepages] Looking up: %s in %s, %s", name, city, state)
 
         try:
             async with session.get(self.base_url, params=params, headers=headers) as resp:
                 if resp.status == 429:
-                    print(f"[Whitepages] Rate limit exceeded")
+                    logger.warning("[Whitepages] Rate limit exceeded")
                     return None
                 if resp.status == 403:
-                    print(f"[Whitepages] Authentication failed - check API key")
+                    logger.warning("[Whitepages] Authentication failed - check API key")
                     return None
                 if resp.status != 200:
                     text = await resp.text()
-                    print(f"[Whitepages] API error {resp.status}: {text[:200]}")
+                    logger.warning("[Whitepages] API error %s: %s", resp.status, text[:200])
                     return None
 
                 data = await resp.json()
-                print(f"[Whitepages] Response received ({len(data) if isinstance(data, list) else 0} results), parsing...")
+                logger.debug("[Whitepages] Response received (%d results), parsing...", len(data) if isinstance(data, list) else 0)
 
                 # Response is an array of PersonResponseDto objects
                 if not data or not isinstance(data, list) or len(data) == 0:
-                    print(f"[Whitepages] No results found for {name}")
+                    logger.debug("[Whitepages] No results found for %s", name)
+                    # Remember the miss so later runs don't pay for the same lookup
+                    await self.cache.aset("whitepages_person", cache_key, value=WHITEPAGES_MISS)
                     return None
 
                 # Filter results by state if provided (API doesn't support state param)
@@ -1303,7 +1493,7 @@ class WhitepagesClient:
                         # Address format: "514 Whilden St Mount Pleasant, SC 29464"
                         if target_state and f", {target_state} " in addr_str.upper():
                             person = candidate
-                            print(f"[Whitepages] Found match in {target_state}: {candidate.get('name')}")
+                            logger.debug("[Whitepages] Found match in %s: %s", target_state, candidate.get('name'))
                             break
                     if person:
                         break
@@ -1311,7 +1501,7 @@ class WhitepagesClient:
                 # If no state match found, use first result
                 if not person:
                     person = data[0]
-                    print(f"[Whitepages] No state match, using first result: {person.get('name')}")
+                    logger.debug("[Whitepages] No state match, using first result: %s", person.get('name'))
 
                 # Initialize result structure
                 result = {
@@ -1332,20 +1522,15 @@ class WhitepagesClient:
                     # Parse using regex to handle multi-word cities
                     if full_address:
                         # Pattern: "street city, ST zip" where city can be multiple words
-                        import re
                         # Match: anything, 2-letter state, 5-digit zip
-                        match = re.match(r'^(.+),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)$', full_address)
+                        match = _RE_CITY_STATE_ZIP.match(full_address)
                         if match:
                             street_city = match.group(1).strip()
                             result["personal_state"] = match.group(2)
                             result["personal_zip"] = match.group(3)
                             # Now split street from city - look for common street suffixes
                             # Street suffixes: St, Ave, Rd, Dr, Blvd, Ln, Ct, Way, Pl, Cir, etc.
-                            street_match = re.match(
-                                r'^(.+?\s+(?:St|Ave|Rd|Dr|Blvd|Ln|Ct|Way|Pl|Cir|Ter|Pkwy|Hwy|Loop|Trl|Run|Pass|Cv)\.?)\s+(.+)$',
-                                street_city,
-                                re.IGNORECASE
-                            )
+                            street_match = _RE_STREET_CITY.match(street_city)
                             if street_match:
                                 result["personal_address"] = street_match.group(1)
                                 result["personal_city"] = street_match.group(2)
@@ -1354,31 +1539,34 @@ class WhitepagesClient:
                                 result["personal_address"] = street_city
                         else:
                             result["personal_address"] = full_address
-                    print(f"[Whitepages] Found address: {result['personal_address']}, {result['personal_city']}, {result['personal_state']} {result['personal_zip']}")
+                    logger.debug(
+                        "[Whitepages] Found address: %s, %s, %s %s",
+                        result['personal_address'], result['personal_city'], result['personal_state'], result['personal_zip'],
+                    )
 
                 # Parse phone (first one with highest score) - new API structure
                 phones = person.get("phones", [])
                 if phones:
                     # Phones are already sorted by score (highest first)
                     result["personal_phone"] = phones[0].get("number", "")
-                    print(f"[Whitepages] Found phone: {result['personal_phone']}")
+                    logger.debug("[Whitepages] Found phone: %s", result['personal_phone'])
 
                 # Parse email (first one) - new API now includes emails
                 emails = person.get("emails", [])
                 if emails:
                     result["personal_email"] = emails[0]
-                    print(f"[Whitepages] Found email: {result['personal_email']}")
+                    logger.debug("[Whitepages] Found email: %s", result['personal_email'])
 
                 # Cache the result
-                self.cache.set("whitepages_person", cache_key, value=result)
-                print(f"[Whitepages] Cached result for {name}")
+                await self.cache.aset("whitepages_person", cache_key, value=result)
+                logger.debug("[Whitepages] Cached result for %s", name)
                 return result
 
         except aiohttp.ClientError as e:
-            print(f"[Whitepages] Connection error for {name}: {e}")
+            logger.warning("[Whitepages] Connection error for %s: %s", name, e)
             return None
         except Exception as e:
-            print(f"[Whitepages] Error for {name}: {e}")
+            logger.warning("[Whitepages] Error for %s: %s", name, e)
             return None
 
 
@@ -1386,48 +1574,37 @@ class WhitepagesClient:
 # Data Processing
 # ============================================================================
 
-def clean_str(val) -> str:
-    """Clean a value to string, handling NaN and None."""
-    if pd.isna(val) or val is None:
-        return ""
-    s = str(val).strip()
-    if s.lower() == "nan":
-        return ""
-    return s
+# Input columns consumed by parse_csv_row/parse_records; anything else in the file is ignored
+INPUT_COLUMNS = frozenset(
+    ["fein", "name", "lat", "long", "address", "city", "state", "zip",
+     "phone", "county", "expdate", "website", "email1"]
+    + [f"name{i}" for i in range(1, 11)]
+    + [f"phone{i}" for i in range(1, 11)]
+)
 
 
-def clean_fein(val) -> str:
-    """Clean FEIN value, removing decimal places from float conversion."""
-    if pd.isna(val) or val is None:
-        return ""
-    # If it's a float that represents an int, convert properly
-    if isinstance(val, float) and val == int(val):
-        return str(int(val))
-    s = str(val).strip()
-    if s.lower() == "nan":
-        return ""
-    # Remove .0 suffix if present
-    if s.endswith(".0"):
-        s = s[:-2]
-    return s
+# Input columns with few distinct values, whose strings are interned when parsed
+LOW_CARDINALITY_COLUMNS = frozenset(["city", "state", "county"])
 
 
-def parse_csv_row(row: pd.Series) -> RestaurantRecord:
-    """Parse a CSV row into a RestaurantRecord."""
+def _record_from(get: Callable[[str], Any]) -> RestaurantRecord:
+    """Build a RestaurantRecord, reading each input column through get(column)."""
+    lat = get("lat")
+    lng = get("long")
     record = RestaurantRecord(
-        fein=clean_fein(row.get("fein")),
-        llc_name=clean_str(row.get("name")),
-        lat=float(row["lat"]) if pd.notna(row.get("lat")) and row.get("lat") != "" else None,
-        lng=float(row["long"]) if pd.notna(row.get("long")) and row.get("long") != "" else None,
-        address=clean_str(row.get("address")),
-        city=clean_str(row.get("city")),
-        state=clean_str(row.get("state")),
-        zip_code=clean_str(row.get("zip")),
-        phone=clean_str(row.get("phone")),
-        email=clean_str(row.get("email1")),
-        county=clean_str(row.get("county")),
-        expdate=clean_str(row.get("expdate")),
-        website=clean_str(row.get("website"))
+        fein=clean_fein(get("fein")),
+        llc_name=clean_str(get("name")),
+        lat=float(lat) if not is_missing(lat) and lat != "" else None,
+        lng=float(lng) if not is_missing(lng) and lng != "" else None,
+        address=clean_str(get("address")),
+        city=sys.intern(clean_str(get("city"))),
+        state=sys.intern(clean_str(get("state"))),
+        zip_code=clean_str(get("zip")),
+        phone=clean_str(get("phone")),
+        email=clean_str(get("email1")),
+        county=sys.intern(clean_str(get("county"))),
+        expdate=clean_str(get("expdate")),
+        website=clean_str(get("website"))
     )
 
     # Parse persons from CSV (name1-10, phone1-10)
@@ -1435,8 +1612,8 @@ def parse_csv_row(row: pd.Series) -> RestaurantRecord:
         name_col = f"name{i}"
         phone_col = f"phone{i}"
 
-        name = clean_str(row.get(name_col))
-        phone = clean_str(row.get(phone_col))
+        name = clean_str(get(name_col))
+        phone = clean_str(get(phone_col))
 
         if name:
             record.persons_from_csv.append(PersonInfo(name=name, phone=phone if phone else None, source="csv"))
@@ -1444,12 +1621,134 @@ def parse_csv_row(row: pd.Series) -> RestaurantRecord:
     return record
 
 
-def extract_dba_from_name(llc_name: str) -> Optional[str]:
-    """Extract DBA from LLC name if present (e.g., 'BUMPER CROP LLC DBA FIG')."""
-    dba_match = re.search(r'\bDBA\s+(.+)$', llc_name, re.IGNORECASE)
-    if dba_match:
-        return dba_match.group(1).strip()
-    return None
+def read_excel(source, usecols=None) -> pd.DataFrame:
+    """Read an Excel workbook with calamine, with Arrow-backed dtypes where the columns allow.
+
+    Reading straight into Arrow dtypes rejects a column that mixes types (e.g. 29407
+    and "29407-1234" in one zip column), so the sheet is read as plain dtypes first;
+    such columns stay object dtype.
+    """
+    import pyarrow as pa
+
+    df = pd.read_excel(source, engine="calamine", usecols=usecols)
+    try:
+        return df.convert_dtypes(dtype_backend="pyarrow")
+    except pa.ArrowInvalid:
+        return df
+
+
+def read_input(path: Path) -> pd.DataFrame:
+    """Read the input columns of a CSV or Excel file, with Arrow-backed dtypes where possible.
+
+    CSVs go through pyarrow's multithreaded reader; pandas takes over when Arrow
+    rejects the file (e.g. a column whose type changes after the first block).
+    """
+    if path.suffix.lower() in [".xlsx", ".xls"]:
+        return read_excel(path, usecols=INPUT_COLUMNS.__contains__)
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    try:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+    except pa.ArrowInvalid:
+        return pd.read_csv(path, usecols=INPUT_COLUMNS.__contains__, dtype_backend="pyarrow")
+    table = table.select([name for name in table.column_names if name in INPUT_COLUMNS])
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def parse_csv_row(row: Mapping[str, Any]) -> RestaurantRecord:
+    """Parse a CSV row (e.g. one dict from df.to_dict(orient="records")) into a RestaurantRecord."""
+    return _record_from(row.get)
+
+
+def _clean_column(col: Optional[pd.Series], n: int) -> list[str]:
+    """clean_str applied to a whole column (all "" if the column is missing)."""
+    if col is None:
+        return [""] * n
+    if pd.api.types.is_datetime64_any_dtype(col.dtype):
+        # astype("string") drops midnight times that str() keeps
+        col = col.map(str, na_action="ignore")
+    text = col.astype("string").str.strip()
+    return text.mask(text.str.lower() == "nan", "").fillna("").tolist()
+
+
+def _clean_fein_column(col: Optional[pd.Series], n: int) -> list[str]:
+    """clean_fein applied to a whole column (all "" if the column is missing)."""
+    # Integral floats render as "123.0", so dropping ".0" also covers them
+    return [s[:-2] if s.endswith(".0") else s for s in _clean_column(col, n)]
+
+
+def _coordinate_column(col: Optional[pd.Series], n: int) -> list[Any]:
+    """Raw coordinate values, with None wherever the value is missing or empty."""
+    if col is None:
+        return [None] * n
+    present = (col.notna() & (col.astype("string") != "")).tolist()
+    return [v if ok else None for v, ok in zip(col.tolist(), present)]
+
+
+def parse_records(
+    df: pd.DataFrame,
+    on_error: Optional[Callable[[Exception], None]] = None
+) -> list[RestaurantRecord]:
+    """Parse every row of df into a RestaurantRecord, cleaning a column at a time.
+
+    Produces the same records as parse_csv_row on each row. A row whose lat/long
+    isn't a number is passed to on_error and skipped; without on_error the
+    error propagates.
+    """
+    n = len(df)
+    lats = _coordinate_column(df.get("lat"), n)
+    lngs = _coordinate_column(df.get("long"), n)
+    text = zip(
+        _clean_fein_column(df.get("fein"), n),
+        *(
+            # Few distinct cities/states/counties repeat across rows; share one string each
+            list(map(sys.intern, _clean_column(df.get(col), n))) if col in LOW_CARDINALITY_COLUMNS
+            else _clean_column(df.get(col), n)
+            for col in ("name", "address", "city", "state", "zip", "phone", "email1", "county", "expdate", "website")
+        ),
+    )
+    names = zip(*(_clean_column(df.get(f"name{i}"), n) for i in range(1, 11)))
+    phones = zip(*(_clean_column(df.get(f"phone{i}"), n) for i in range(1, 11)))
+
+    records = []
+    for lat, lng, values, row_names, row_phones in zip(lats, lngs, text, names, phones):
+        try:
+            lat = float(lat) if lat is not None else None
+            lng = float(lng) if lng is not None else None
+        except (TypeError, ValueError) as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            continue
+
+        fein, llc_name, address, city, state, zip_code, phone, email, county, expdate, website = values
+        records.append(RestaurantRecord(
+            fein=fein,
+            llc_name=llc_name,
+            lat=lat,
+            lng=lng,
+            address=address,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            phone=phone,
+            email=email,
+            county=county,
+            expdate=expdate,
+            website=website,
+            persons_from_csv=[
+                PersonInfo(name=name, phone=person_phone or None, source="csv")
+                for name, person_phone in zip(row_names, row_phones)
+                if name
+            ],
+        ))
+
+    return records
 
 
 def fuzzy_match_owner(
@@ -1458,25 +1757,27 @@ def fuzzy_match_owner(
     threshold: int = 80
 ) -> Optional[PersonInfo]:
     """Find a matching person using fuzzy string matching."""
+    from rapidfuzz import fuzz, process
+
     owner_name_normalized = owner_name.lower().strip()
+    person_names_normalized = [person.name_norm for person in persons]
 
     best_match = None
     best_score = 0
+    best_index = len(persons)
 
-    for person in persons:
-        person_name_normalized = person.name.lower().strip()
-
-        # Try different matching strategies
-        scores = [
-            fuzz.ratio(owner_name_normalized, person_name_normalized),
-            fuzz.partial_ratio(owner_name_normalized, person_name_normalized),
-            fuzz.token_sort_ratio(owner_name_normalized, person_name_normalized)
-        ]
-
-        max_score = max(scores)
-        if max_score > best_score and max_score >= threshold:
-            best_score = max_score
-            best_match = person
+    # Try different matching strategies, each scoring every person in one C call
+    for scorer in (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio):
+        match = process.extractOne(
+            owner_name_normalized, person_names_normalized, scorer=scorer, score_cutoff=threshold
+        )
+        if match is None:
+            continue
+        _, score, index = match
+        # Highest score wins; ties go to the person listed first
+        if score > best_score or (best_match is not None and score == best_score and index < best_index):
+            best_score, best_index = score, index
+            best_match = persons[index]
 
     return best_match
 
@@ -1488,9 +1789,14 @@ async def process_record(
     perplexity_client: PerplexityClient,
     whitepages_client: WhitepagesClient,
     yelp_client: Optional[YelpClient],
-    semaphore: asyncio.Semaphore
+    semaphore: asyncio.Semaphore,
+    csv_only_when_sufficient: bool = False
 ) -> RestaurantRecord:
-    """Process a single restaurant record through the enrichment pipeline."""
+    """Process a single restaurant record through the enrichment pipeline.
+
+    With csv_only_when_sufficient, a record whose CSV persons include one with a
+    phone number takes that person as its owner and skips the Perplexity owner search.
+    """
 
     async with semaphore:
         log_verbose(f"Processing: {record.llc_name}")
@@ -1568,17 +1874,23 @@ async def process_record(
 
         log_verbose(f"  Final restaurant name: '{record.restaurant_name}'")
 
-        # Step 2: Find owners via multi-strategy Perplexity search
-        log_verbose(f"  Finding owners for '{record.restaurant_name}' (multi-strategy)...")
-        owner_results = await perplexity_client.find_owners_multi_strategy(
-            record.restaurant_name,
-            record.llc_name,
-            record.address,
-            record.city,
-            record.state,
-            record.website,
-            record.persons_from_csv
-        )
+        # Step 2: Find owners via multi-strategy Perplexity search, unless the CSV
+        # already lists a contact with a phone and the caller settles for that
+        # (the CSV fallback below then picks that person)
+        if csv_only_when_sufficient and any(p.phone for p in record.persons_from_csv):
+            log_verbose("  CSV has a contact with a phone, skipping owner search")
+            owner_results = []
+        else:
+            log_verbose(f"  Finding owners for '{record.restaurant_name}' (multi-strategy)...")
+            owner_results = await perplexity_client.find_owners_multi_strategy(
+                record.restaurant_name,
+                record.llc_name,
+                record.address,
+                record.city,
+                record.state,
+                record.website,
+                record.persons_from_csv
+            )
 
         # Step 3: Select best owner based on confidence scores
         best_owner = None
@@ -1653,6 +1965,13 @@ async def process_record(
         return record
 
 
+# Columns of the rows format_output_row builds, in output order
+OUTPUT_COLUMNS = [
+    "FEIN", "Name", "OwnerName", "Address", "City", "State", "Zip", "Phone", "Email",
+    "County", "Expdate", "Website", "LLC_Name", "ContactSource",
+]
+
+
 def format_output_row(record: RestaurantRecord) -> dict:
     """Format a RestaurantRecord into a single output row.
 
@@ -1718,11 +2037,32 @@ def format_output_row(record: RestaurantRecord) -> dict:
 # Main Pipeline
 # ============================================================================
 
+def open_http_session(batch_size: int = 10) -> aiohttp.ClientSession:
+    """Open an aiohttp session with a connection pool sized for batch_size concurrent records.
+
+    Each record talks to one API host at a time, so batch_size connections per
+    host are kept alive and reused. Call from within a running event loop.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(
+        limit=batch_size * 3,  # Google Places, Yelp and Whitepages
+        limit_per_host=batch_size,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+    )
+
+
 async def process_batch(
     records: list[RestaurantRecord],
     config: Config,
     batch_size: int = 10,
-    progress_callback: Optional[Callable[[int, int, str], None]] = None
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> list[RestaurantRecord]:
     """Process records in parallel batches.
     
@@ -1733,11 +2073,23 @@ async def process_batch(
         progress_callback: Optional callback for progress updates.
             Signature: (current: int, total: int, message: str) -> None
             If None, uses tqdm for CLI progress display.
+        session: Optional aiohttp session to reuse (its connection pool survives
+            across calls). If None, a session is opened and closed here.
     
     Returns:
         List of enriched RestaurantRecord objects
     """
+    results: list[RestaurantRecord] = []
+    async for chunk in process_batch_chunks(records, config, batch_size, progress_callback, session):
+        results.extend(chunk)
+    return results
+
 
+def _record_processor(
+    config: Config,
+    batch_size: int
+) -> Callable[[RestaurantRecord, aiohttp.ClientSession], Awaitable[RestaurantRecord]]:
+    """Build the cache and API clients once, returning a function that runs process_record with them."""
     cache = CacheManager(config.cache_dir)
     google_client = GooglePlacesClient(config.google_places_api_key, cache)
     perplexity_client = PerplexityClient(config.openrouter_api_key, cache)
@@ -1748,45 +2100,154 @@ async def process_batch(
 
     # Semaphore to limit concurrent API calls
     semaphore = asyncio.Semaphore(batch_size)
+
+    def process(record: RestaurantRecord, session: aiohttp.ClientSession) -> Awaitable[RestaurantRecord]:
+        return process_record(
+            record,
+            session,
+            google_client,
+            perplexity_client,
+            whitepages_client,
+            yelp_client,
+            semaphore,
+            config.csv_only_when_sufficient
+        )
+
+    return process
+
+
+async def process_record_stream(
+    records: AsyncIterator[RestaurantRecord],
+    total: int,
+    config: Config,
+    batch_size: int = 10,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> list[RestaurantRecord]:
+    """process_batch for records that arrive over time (e.g. while the input is still being parsed).
+
+    Each record starts as soon as it arrives, with at most GATHER_CHUNK_SIZE
+    unfinished at once; one set of clients and one HTTP session serve the whole
+    stream. total is the expected record count, used only for progress reports.
+    Results are returned in arrival order.
+    """
+    process = _record_processor(config, batch_size)
+
+    owns_session = session is None
+    if owns_session:
+        session = open_http_session(batch_size)
+
+    tasks: list[asyncio.Future] = []
+    pending: set[asyncio.Future] = set()
+    completed = 0
+
+    async def wait_for_one() -> None:
+        """Wait until at least one pending record finishes, and report it."""
+        nonlocal pending, completed
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            result = task.result()
+            completed += 1
+            if progress_callback is not None:
+                display_name = result.restaurant_name or result.llc_name or "Unknown"
+                progress_callback(completed, total, f"Processed: {display_name}")
+
+    try:
+        async for record in records:
+            if len(pending) >= GATHER_CHUNK_SIZE:
+                await wait_for_one()
+            task = asyncio.ensure_future(process(record, session))
+            tasks.append(task)
+            pending.add(task)
+        while pending:
+            await wait_for_one()
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+    finally:
+        if owns_session:
+            await session.close()
+
+    return [task.result() for task in tasks]
+
+
+async def process_batch_chunks(
+    records: list[RestaurantRecord],
+    config: Config,
+    batch_size: int = 10,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> AsyncIterator[list[RestaurantRecord]]:
+    """process_batch, yielding the enriched records GATHER_CHUNK_SIZE at a time.
+
+    Chunks come out in input order as each one finishes, so a caller can write
+    them out and drop them instead of holding every result until the end.
+    Arguments are as for process_batch.
+    """
+    from tqdm import tqdm
+
+    process = _record_processor(config, batch_size)
     total = len(records)
 
-    async with aiohttp.ClientSession() as session:
-        if progress_callback is None:
-            # CLI mode: use tqdm for progress display
+    owns_session = session is None
+    if owns_session:
+        session = open_http_session(batch_size)
+
+    if progress_callback is None:
+        # CLI mode: use tqdm for progress display
+        progress_bar = tqdm(total=total, desc="Processing records")
+        progress_callback = lambda current, total, message: progress_bar.update()
+    else:
+        progress_bar = None
+
+    completed = 0
+
+    try:
+        # Schedule GATHER_CHUNK_SIZE records at a time, so a large file never has
+        # a task per record alive at once; the semaphore limits concurrency
+        for start in range(0, total, GATHER_CHUNK_SIZE):
             tasks = [
-                process_record(
-                    record,
-                    session,
-                    google_client,
-                    perplexity_client,
-                    whitepages_client,
-                    yelp_client,
-                    semaphore
-                )
-                for record in records
+                asyncio.ensure_future(process(record, session))
+                for record in records[start:start + GATHER_CHUNK_SIZE]
             ]
-            results = await tqdm_asyncio.gather(*tasks, desc="Processing records")
-        else:
-            # Streamlit mode: use callback for progress updates
-            results = []
-            for i, record in enumerate(records):
-                # Process one record at a time to provide accurate progress
-                result = await process_record(
-                    record,
-                    session,
-                    google_client,
-                    perplexity_client,
-                    whitepages_client,
-                    yelp_client,
-                    semaphore
-                )
-                results.append(result)
-                
-                # Report progress via callback
-                display_name = result.restaurant_name or result.llc_name or "Unknown"
-                progress_callback(i + 1, total, f"Processed: {display_name}")
+            try:
+                # Report progress as each record finishes
+                for finished in asyncio.as_completed(tasks):
+                    result = await finished
+                    completed += 1
+                    display_name = result.restaurant_name or result.llc_name or "Unknown"
+                    progress_callback(completed, total, f"Processed: {display_name}")
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            yield [task.result() for task in tasks]
+    finally:
+        if progress_bar is not None:
+            progress_bar.close()
+        if owns_session:
+            await session.close()
+
+
+async def write_output(
+    records: list[RestaurantRecord],
+    config: Config,
+    batch_size: int,
+    writer: csv.DictWriter
+) -> tuple[int, int, int]:
+    """Process records and write an output row per record with an owner found.
 
-    return results
+    Returns (records processed, records with owners, owners with phone numbers).
+    """
+    processed_count = with_owners_count = owners_with_phone = 0
+    async for chunk in process_batch_chunks(records, config, batch_size):
+        with_owners = [r for r in chunk if r.owners]
+        writer.writerows(format_output_row(record) for record in with_owners)
+        processed_count += len(chunk)
+        with_owners_count += len(with_owners)
+        owners_with_phone += sum(1 for r in with_owners for o in r.owners if o.phone)
+    return processed_count, with_owners_count, owners_with_phone
 
 
 def main():
@@ -1811,6 +2272,11 @@ Environment Variables:
     parser.add_argument("--batch-size", type=int, default=10, help="Parallel batch size")
     parser.add_argument("--cache-dir", default=".cache", help="Cache directory")
     parser.add_argument("--limit", type=int, default=None, help="Limit number of records to process (for testing)")
+    parser.add_argument(
+        "--csv-only-when-sufficient",
+        action="store_true",
+        help="Skip the owner search for records whose CSV contacts include one with a phone number",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging for debugging")
 
     args = parser.parse_args()
@@ -1818,9 +2284,11 @@ Environment Variables:
     # Set verbose mode
     global VERBOSE
     VERBOSE = args.verbose
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.DEBUG if VERBOSE else logging.WARNING)
 
     # Initialize config
-    config = Config(cache_dir=Path(args.cache_dir))
+    config = Config(cache_dir=Path(args.cache_dir), csv_only_when_sufficient=args.csv_only_when_sufficient)
     config.validate()
 
     # Read input file
@@ -1831,46 +2299,37 @@ Environment Variables:
 
     print(f"Reading input file: {args.input}")
 
-    if input_path.suffix.lower() in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_path)
-    else:
-        df = pd.read_csv(input_path)
+    df = read_input(input_path)
 
     print(f"Loaded {len(df)} records")
 
+    # Apply limit if specified (before parsing, so rows past it are never parsed)
+    if args.limit is not None:
+        df = df.iloc[:args.limit]
+        print(f"Limited to {len(df)} records")
+
     # Parse records
     print("Parsing records...")
-    records = [parse_csv_row(row) for _, row in tqdm(df.iterrows(), total=len(df), desc="Parsing")]
+    records = parse_records(df)
 
-    # Apply limit if specified
-    if args.limit is not None:
-        records = records[:args.limit]
-        print(f"Limited to {len(records)} records")
-
-    # Process records
+    # Process records, writing each finished chunk's records with owners found
+    # straight to the output file
     print(f"Processing records with batch size {args.batch_size}...")
-    processed_records = asyncio.run(process_batch(records, config, args.batch_size))
+    with open(args.output, "w", newline="", encoding="utf-8") as output_file:
+        writer = csv.DictWriter(output_file, fieldnames=OUTPUT_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        summary = asyncio.run(write_output(records, config, args.batch_size, writer))
 
-    # Filter to only records with owners found, then format output
-    print("Formatting output...")
-    records_with_owners = [r for r in processed_records if r.owners]
-    records_without_owners = len(processed_records) - len(records_with_owners)
-    output_rows = [format_output_row(record) for record in records_with_owners]
-
-    # Write output
-    output_df = pd.DataFrame(output_rows)
-    output_df.to_csv(args.output, index=False)
+    processed_count, with_owners_count, owners_with_phone = summary
 
     print(f"\nOutput written to: {args.output}")
-    print(f"Total output rows: {len(output_rows)}")
+    print(f"Total output rows: {with_owners_count}")
 
     # Summary
-    owners_with_phone = sum(1 for r in records_with_owners for o in r.owners if o.phone)
-
     print(f"\nSummary:")
-    print(f"  Records processed: {len(processed_records)}")
-    print(f"  Records with owners found: {len(records_with_owners)}")
-    print(f"  Records skipped (no owner): {records_without_owners}")
+    print(f"  Records processed: {processed_count}")
+    print(f"  Records with owners found: {with_owners_count}")
+    print(f"  Records skipped (no owner): {processed_count - with_owners_count}")
     print(f"  Owners with phone numbers: {owners_with_phone}")
 
 
@@ -0,0 +1,68 @@
+"""Tests for the REST API in its no-Redis (SQLite job store) mode."""
+
+import io
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+
+
+CSV = b"fein,name,city,state\n123,BUMPER CROP LLC DBA FIG,Charleston,SC\n"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """A TestClient with the API keys set and jobs stored under tmp_path."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test")
+    monkeypatch.setenv("JOBS_DB", str(tmp_path / "jobs.db"))
+    monkeypatch.chdir(tmp_path)
+    api.get_config.cache_clear()
+    api.upload_files.clear()
+    api.upload_digests.clear()
+    with TestClient(api.app) as test_client:
+        yield test_client
+    api.get_config.cache_clear()
+
+
+def test_reupload_of_started_file_gets_new_job(client, monkeypatch):
+    """Re-uploading a file whose job is already running creates a job that can be started."""
+    async def run_enrichment(job_id, file_path, config):
+        # Leave the job processing, as a long enrichment would
+        api.job_store.mark_processing(job_id)
+
+    monkeypatch.setattr(api, "run_enrichment", run_enrichment)
+
+    first = client.post("/api/upload?session_id=s1", files={"file": ("leads.csv", CSV)})
+    assert first.status_code == 200
+    first_id = first.json()["job_id"]
+    assert client.post(f"/api/jobs/{first_id}/start").status_code == 200
+
+    second = client.post("/api/upload?session_id=s1", files={"file": ("leads.csv", CSV)})
+    assert second.status_code == 200
+    second_id = second.json()["job_id"]
+    assert second_id != first_id
+    assert client.post(f"/api/jobs/{second_id}/start").status_code == 200
+
+
+def test_reupload_of_pending_file_reuses_job(client):
+    """Re-uploading a file before its job is started returns the same job."""
+    first = client.post("/api/upload?session_id=s1", files={"file": ("leads.csv", CSV)})
+    second = client.post("/api/upload?session_id=s1", files={"file": ("leads.csv", CSV)})
+    assert second.json()["job_id"] == first.json()["job_id"]
+
+
+def test_upload_excel_with_mixed_type_column(client):
+    """An Excel column holding both numbers and text (e.g. ZIP and ZIP+4) uploads fine."""
+    buf = io.BytesIO()
+    pd.DataFrame({
+        "name": ["FIG LLC", "BUMPER CROP LLC"],
+        "zip": [29407, "29407-1234"],
+    }).to_excel(buf, index=False)
+
+    response = client.post("/api/upload?session_id=s1", files={"file": ("leads.xlsx", buf.getvalue())})
+    assert response.status_code == 200
+    assert response.json()["total_records"] == 2